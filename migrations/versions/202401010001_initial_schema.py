@@ -2,6 +2,7 @@
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.schema import CreateTable
 
 # revision identifiers, used by Alembic.
 revision = "202401010001"
@@ -10,41 +11,44 @@ branch_labels = None
 depends_on = None
 
 
+_NOW = sa.text("CURRENT_TIMESTAMP")
+
+
 def _timestamp_columns():
     return [
         sa.Column(
             "created_at",
             sa.DateTime(timezone=True),
             nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
+            server_default=_NOW,
         ),
         sa.Column(
             "updated_at",
             sa.DateTime(timezone=True),
             nullable=False,
-            server_default=sa.text("CURRENT_TIMESTAMP"),
-            server_onupdate=sa.text("CURRENT_TIMESTAMP"),
+            server_default=_NOW,
+            server_onupdate=_NOW,
         ),
     ]
 
 
-def upgrade() -> None:
-    event_approval_status = sa.Enum(
-        "pending", "approved", "rejected", name="event_approval_status"
-    )
-    bind = op.get_bind()
-    event_approval_status.create(bind, checkfirst=True)
+def _build_metadata(event_approval_status: sa.Enum) -> sa.MetaData:
+    """Describe the initial schema on a standalone metadata collection."""
+
+    metadata = sa.MetaData()
 
-    op.create_table(
+    sa.Table(
         "event_series",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("name", sa.String(length=200), nullable=False, unique=True),
         sa.Column("description", sa.Text(), nullable=True),
         *_timestamp_columns(),
     )
 
-    op.create_table(
+    sa.Table(
         "event_templates",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("name", sa.String(length=200), nullable=False, unique=True),
         sa.Column("description", sa.Text(), nullable=True),
@@ -52,23 +56,26 @@ def upgrade() -> None:
         *_timestamp_columns(),
     )
 
-    op.create_table(
+    sa.Table(
         "event_categories",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("name", sa.String(length=128), nullable=False, unique=True),
         sa.Column("description", sa.Text(), nullable=True),
         *_timestamp_columns(),
     )
 
-    op.create_table(
+    sa.Table(
         "event_tags",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("name", sa.String(length=128), nullable=False, unique=True),
         *_timestamp_columns(),
     )
 
-    op.create_table(
+    sa.Table(
         "events",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("title", sa.String(length=255), nullable=False),
         sa.Column("description", sa.Text(), nullable=True),
@@ -92,8 +99,9 @@ def upgrade() -> None:
         sa.CheckConstraint("attendees >= 0", name="ck_events_attendees_non_negative"),
     )
 
-    op.create_table(
+    sa.Table(
         "event_categories_events",
+        metadata,
         sa.Column(
             "event_id",
             sa.Integer(),
@@ -108,8 +116,9 @@ def upgrade() -> None:
         ),
     )
 
-    op.create_table(
+    sa.Table(
         "event_tags_events",
+        metadata,
         sa.Column(
             "event_id",
             sa.Integer(),
@@ -124,8 +133,9 @@ def upgrade() -> None:
         ),
     )
 
-    op.create_table(
+    sa.Table(
         "event_translations",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column(
             "event_id",
@@ -140,8 +150,9 @@ def upgrade() -> None:
         sa.UniqueConstraint("event_id", "locale", name="uq_event_translation_locale"),
     )
 
-    op.create_table(
+    sa.Table(
         "event_approvals",
+        metadata,
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column(
             "event_id",
@@ -156,6 +167,29 @@ def upgrade() -> None:
         *_timestamp_columns(),
     )
 
+    return metadata
+
+
+def upgrade() -> None:
+    event_approval_status = sa.Enum(
+        "pending", "approved", "rejected", name="event_approval_status"
+    )
+    bind = op.get_bind()
+    event_approval_status.create(bind, checkfirst=True)
+    metadata = _build_metadata(event_approval_status)
+
+    if bind.dialect.name == "postgresql":
+        # Send every CREATE TABLE in a single round-trip; the enum type has
+        # already been created above so the compiled DDL can reference it.
+        statements = [
+            str(CreateTable(table).compile(dialect=bind.dialect)).strip()
+            for table in metadata.sorted_tables
+        ]
+        # ``op.execute`` also emits the batch in offline (--sql) mode.
+        op.execute(sa.text(";\n".join(statements)))
+    else:
+        metadata.create_all(bind, checkfirst=False)
+
 
 def downgrade() -> None:
     op.drop_table("event_approvals")
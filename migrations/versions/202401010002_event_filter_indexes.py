@@ -0,0 +1,26 @@
+"""Index the columns used by the event listing filters."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202401010002"
+down_revision = "202401010001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_event_date", "events", ["event_date"])
+    op.create_index(
+        "ix_events_event_type_lower", "events", [sa.text("lower(event_type)")]
+    )
+    op.create_index(
+        "ix_events_location_lower", "events", [sa.text("lower(location)")]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_location_lower", table_name="events")
+    op.drop_index("ix_events_event_type_lower", table_name="events")
+    op.drop_index("ix_events_event_date", table_name="events")
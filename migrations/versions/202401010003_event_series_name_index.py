@@ -0,0 +1,20 @@
+"""Index event series names for case-insensitive lookups."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202401010003"
+down_revision = "202401010002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_series_name_lower", "event_series", [sa.text("lower(name)")]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_series_name_lower", table_name="event_series")
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Dict, Optional
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResilienceConfig:
     """Retry and circuit breaker settings for outbound integrations."""
 
@@ -18,7 +19,11 @@ class ResilienceConfig:
     circuit_breaker_reset_timeout: float = 30.0
 
 
-@dataclass(frozen=True)
+# Resilience settings are immutable, so services share one default instance.
+_DEFAULT_RESILIENCE = ResilienceConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     """Configuration for a downstream dependency."""
 
@@ -27,14 +32,14 @@ class ServiceConfig:
     protocol: str = "http"
     timeout: float = 5.0
     secret: Optional[str] = None
-    resilience: ResilienceConfig = field(default_factory=ResilienceConfig)
+    resilience: ResilienceConfig = _DEFAULT_RESILIENCE
 
 
 @dataclass(frozen=True)
 class AppConfig:
     """Aggregate application configuration."""
 
-    services: Dict[str, ServiceConfig]
+    services: Mapping[str, ServiceConfig]
 
     def service(self, name: str) -> ServiceConfig:
         try:
@@ -43,36 +48,40 @@ class AppConfig:
             raise KeyError(f"Unknown service configuration requested: {name}") from exc
 
 
-def _get_env_name(service_name: str, key: str) -> str:
-    return f"{service_name.upper()}_{key.upper()}"
+_RESILIENCE_SPECS = (
+    ("max_attempts", "MAX_ATTEMPTS", int, 3),
+    ("backoff_factor", "BACKOFF_FACTOR", float, 0.5),
+    ("max_backoff", "MAX_BACKOFF", float, 5.0),
+    ("circuit_breaker_failure_threshold", "CB_FAILURE_THRESHOLD", int, 5),
+    ("circuit_breaker_reset_timeout", "CB_RESET_TIMEOUT", float, 30.0),
+)
 
 
-def _load_resilience(service_name: str) -> ResilienceConfig:
-    def _get_int(var: str, default: int) -> int:
-        value = os.getenv(_get_env_name(service_name, var))
-        if value is None:
-            return default
-        try:
-            return int(value)
-        except ValueError:
-            return default
-
-    def _get_float(var: str, default: float) -> float:
-        value = os.getenv(_get_env_name(service_name, var))
-        if value is None:
-            return default
+def _parse_specs(
+    env: Mapping[str, str], prefix: str, specs: Tuple[Tuple[str, str, Any, Any], ...]
+) -> Dict[str, Any]:
+    """Read ``<prefix>_<suffix>`` variables, falling back to defaults when unset.
+
+    Empty numeric values count as unset; empty strings are kept as given.
+    Values that fail to parse raise ``ValueError`` naming the variable.
+    """
+
+    values: Dict[str, Any] = {}
+    for attr, suffix, parser, default in specs:
+        name = f"{prefix}_{suffix}"
+        raw = env.get(name)
+        if raw is None or (not raw and parser is not str):
+            values[attr] = default
+            continue
         try:
-            return float(value)
-        except ValueError:
-            return default
-
-    return ResilienceConfig(
-        max_attempts=_get_int("MAX_ATTEMPTS", 3),
-        backoff_factor=_get_float("BACKOFF_FACTOR", 0.5),
-        max_backoff=_get_float("MAX_BACKOFF", 5.0),
-        circuit_breaker_failure_threshold=_get_int("CB_FAILURE_THRESHOLD", 5),
-        circuit_breaker_reset_timeout=_get_float("CB_RESET_TIMEOUT", 30.0),
-    )
+            values[attr] = parser(raw)
+        except ValueError as exc:
+            raise ValueError(f"Invalid value for {name}: {raw!r}") from exc
+    return values
+
+
+def _load_resilience(prefix: str, env: Mapping[str, str]) -> ResilienceConfig:
+    return ResilienceConfig(**_parse_specs(env, prefix, _RESILIENCE_SPECS))
 
 
 def _load_service_config(
@@ -82,51 +91,71 @@ def _load_service_config(
     protocol: str = "http",
     default_timeout: float = 5.0,
 ) -> ServiceConfig:
-    base_url = os.getenv(_get_env_name(service_name, "URL"), default_url)
-    timeout = os.getenv(_get_env_name(service_name, "TIMEOUT"))
-    secret = os.getenv(_get_env_name(service_name, "SECRET"))
-    parsed_timeout = float(timeout) if timeout else default_timeout
+    env = os.environ
+    prefix = service_name.upper()
+    parsed = _parse_specs(
+        env,
+        prefix,
+        (
+            ("base_url", "URL", str, default_url),
+            ("protocol", "PROTOCOL", str, protocol),
+            ("timeout", "TIMEOUT", float, default_timeout),
+            ("secret", "SECRET", str, None),
+        ),
+    )
 
     return ServiceConfig(
         name=service_name,
-        base_url=base_url,
-        protocol=os.getenv(_get_env_name(service_name, "PROTOCOL"), protocol),
-        timeout=parsed_timeout,
-        secret=secret,
-        resilience=_load_resilience(service_name),
+        resilience=_load_resilience(prefix, env),
+        **parsed,
     )
 
 
-@lru_cache()
-def get_config() -> AppConfig:
-    """Return the lazily initialised application configuration."""
+_SERVICE_DEFINITIONS = (
+    ("user_service", "http://user-service.local/api", "http"),
+    ("matching_service", "localhost:50051", "grpc"),
+    ("payment_service", "http://payment-service.local/api", "http"),
+    ("calendar_service", "http://calendar-service.local/api", "http"),
+    ("email_service", "http://email-service.local/api", "http"),
+    ("social_service", "http://social-service.local/api", "http"),
+)
+
 
+def _build_config() -> AppConfig:
     services = {
-        "user_service": _load_service_config(
-            "user_service", default_url="http://user-service.local/api"
-        ),
-        "matching_service": _load_service_config(
-            "matching_service", default_url="localhost:50051", protocol="grpc"
-        ),
-        "payment_service": _load_service_config(
-            "payment_service", default_url="http://payment-service.local/api"
-        ),
-        "calendar_service": _load_service_config(
-            "calendar_service", default_url="http://calendar-service.local/api"
-        ),
-        "email_service": _load_service_config(
-            "email_service", default_url="http://email-service.local/api"
-        ),
-        "social_service": _load_service_config(
-            "social_service", default_url="http://social-service.local/api"
-        ),
+        sys.intern(name): _load_service_config(name, default_url=url, protocol=protocol)
+        for name, url, protocol in _SERVICE_DEFINITIONS
     }
-    return AppConfig(services=services)
+    return AppConfig(services=MappingProxyType(services))
+
+
+# The registry is resolved once at import time; the environment is expected to
+# be in place before the integrations are loaded.
+_APP_CONFIG = _build_config()
+_SERVICES = _APP_CONFIG.services
+
+
+def get_config() -> AppConfig:
+    """Return the application configuration resolved at import time."""
+
+    return _APP_CONFIG
+
+
+# Last resolved (name, config) pair. Kept as a single tuple so concurrent
+# readers never observe a name paired with another service's config.
+_LAST_LOOKUP: Tuple[Optional[str], Optional[ServiceConfig]] = (None, None)
 
 
 def get_service_config(service_name: str) -> ServiceConfig:
     """Shortcut to retrieve an individual service configuration."""
 
-    config = get_config()
-    return config.service(service_name)
-
+    global _LAST_LOOKUP
+    last_name, last_config = _LAST_LOOKUP
+    if service_name is last_name:
+        return last_config  # type: ignore[return-value]
+    try:
+        config = _SERVICES[service_name]
+    except KeyError as exc:
+        raise KeyError(f"Unknown service configuration requested: {service_name}") from exc
+    _LAST_LOOKUP = (service_name, config)
+    return config
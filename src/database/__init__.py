@@ -2,18 +2,25 @@
 from __future__ import annotations
 
 import os
+import threading
 from contextlib import contextmanager
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 __all__ = [
     "Base",
     "get_engine",
     "init_engine",
     "get_session",
+    "scoped_db_session",
     "session_scope",
 ]
 
@@ -21,6 +28,8 @@ Base = declarative_base()
 
 _engine: Optional[Engine] = None
 _SessionLocal: Optional[sessionmaker] = None
+_database_url: Optional[str] = None
+_engine_lock = threading.RLock()
 
 
 def _build_database_url() -> str:
@@ -43,8 +52,20 @@ def _build_database_url() -> str:
 
 
 def init_engine(database_url: Optional[str] = None, **engine_kwargs) -> Engine:
-    """Initialise the SQLAlchemy engine and session factory."""
-    global _engine, _SessionLocal
+    """Initialise the SQLAlchemy engine and session factory.
+
+    Re-initialising is a no-op unless a different ``database_url`` or explicit
+    engine options are supplied, so concurrent cold starts share one pool.
+    """
+    with _engine_lock:
+        if _engine is not None and not engine_kwargs:
+            if database_url is None or database_url == _database_url:
+                return _engine
+        return _build_engine(database_url, engine_kwargs)
+
+
+def _build_engine(database_url: Optional[str], engine_kwargs: dict) -> Engine:
+    global _engine, _SessionLocal, _database_url
 
     if database_url is None:
         database_url = _build_database_url()
@@ -52,18 +73,36 @@ def init_engine(database_url: Optional[str] = None, **engine_kwargs) -> Engine:
     if _engine is not None:
         _engine.dispose()
 
-    kwargs = {"future": True, "pool_pre_ping": True}
+    # Pre-ping catches connections dropped while idle in the LIFO pool before
+    # a request uses them; DB_POOL_PRE_PING=false skips the check-out probe.
+    pre_ping = os.getenv("DB_POOL_PRE_PING", "true").lower() in {"1", "true", "yes"}
+    kwargs = {"future": True, "pool_pre_ping": pre_ping}
+    if orjson is not None:
+        kwargs["json_serializer"] = _orjson_dumps
+        kwargs["json_deserializer"] = orjson.loads
     kwargs.update(engine_kwargs)
 
     if database_url.startswith("sqlite"):
         kwargs.setdefault("connect_args", {"check_same_thread": False})
     else:
-        pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
-        max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        _make_psycopg_cooperative()
+        # Sized for a single gevent worker multiplexing many requests; the
+        # stock pool of 5 queues requests well before the database is busy.
+        pool_size = int(os.getenv("DB_POOL_SIZE", "25"))
+        max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "25"))
         kwargs.setdefault("pool_size", pool_size)
         kwargs.setdefault("max_overflow", max_overflow)
+        kwargs.setdefault("pool_recycle", int(os.getenv("DB_POOL_RECYCLE", "1800")))
+        kwargs.setdefault("pool_timeout", int(os.getenv("DB_POOL_TIMEOUT", "10")))
+        # LIFO keeps the hot connections busy and lets idle ones age out.
+        kwargs.setdefault("pool_use_lifo", True)
 
     _engine = create_engine(database_url, **kwargs)
+    if database_url.startswith("sqlite"):
+        # Relationships declared with ``passive_deletes`` rely on ON DELETE
+        # CASCADE, which SQLite only enforces with this pragma.
+        event.listen(_engine, "connect", _enable_sqlite_foreign_keys)
+    _database_url = database_url
     _SessionLocal = sessionmaker(
         bind=_engine,
         autocommit=False,
@@ -75,23 +114,57 @@ def init_engine(database_url: Optional[str] = None, **engine_kwargs) -> Engine:
     return _engine
 
 
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _orjson_dumps(value) -> str:
+    # Non-string keys become strings as with the stdlib encoder; drivers want str.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _make_psycopg_cooperative() -> None:
+    """Let psycopg2 yield to other greenlets while waiting on PostgreSQL.
+
+    Under the gevent worker the stdlib is monkey-patched, but psycopg2 does
+    its I/O in C and would otherwise block every request in the process.
+    """
+    try:
+        from gevent import monkey
+        from psycogreen.gevent import patch_psycopg
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return
+    if monkey.is_module_patched("socket"):
+        patch_psycopg()
+
+
 def get_engine() -> Engine:
     """Return the configured SQLAlchemy engine, initialising if necessary."""
-    global _engine
     if _engine is None:
-        _engine = init_engine()
+        with _engine_lock:
+            if _engine is None:
+                init_engine()
+    assert _engine is not None  # For mypy
     return _engine
 
 
 def get_session() -> Session:
     """Create a new SQLAlchemy session."""
-    global _SessionLocal
     if _SessionLocal is None:
-        init_engine()
+        with _engine_lock:
+            if _SessionLocal is None:
+                init_engine()
     assert _SessionLocal is not None  # For mypy
     return _SessionLocal()
 
 
+# Thread-local (greenlet-local under gevent) registry shared by long-lived
+# services; the factory defers to ``get_session`` so it follows engine resets.
+scoped_db_session = scoped_session(get_session)
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """Provide a transactional scope for database operations."""
@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import json
+import random
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Protocol
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Protocol, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # pragma: no cover - optional dependency for faster JSON handling
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback to the stdlib codec
+    orjson = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency for gRPC
     import grpc  # type: ignore
@@ -16,6 +25,46 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for offline tests
 from src.config import ResilienceConfig, ServiceConfig, get_service_config
 
 
+if orjson is not None:
+
+    def _dumps(payload: Any) -> bytes:
+        # Non-string keys are stringified as the stdlib encoder does.
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+else:  # pragma: no cover - exercised only without orjson installed
+
+    def _dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    _loads = json.loads
+
+
+_ERROR_PREVIEW_BYTES = 512
+
+
+def _preview(content: bytes) -> str:
+    """Decode only the head of a response body for error messages."""
+
+    if not content:
+        return ""
+    return content[:_ERROR_PREVIEW_BYTES].decode("utf-8", errors="replace")
+
+
+def _build_shared_session() -> requests.Session:
+    """Return a session whose connection pool is shared by all HTTP clients."""
+
+    session = requests.Session()
+    # Retries are handled by ``IntegrationClient._execute``; keep urllib3 quiet.
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_shared_session()
+
+
 class IntegrationError(RuntimeError):
     """Raised when a downstream call fails irrecoverably."""
 
@@ -24,39 +73,63 @@ class CircuitOpenError(IntegrationError):
     """Raised when the circuit breaker prevents further calls."""
 
 
-@dataclass
-class _CircuitBreakerState:
-    failures: int = 0
-    open_until: float = 0.0
+class TransientHttpError(IntegrationError):
+    """Raised for HTTP 5xx/429 replies, which are worth retrying."""
+
+
+class InvalidResponseError(IntegrationError):
+    """Raised for 4xx replies and unreadable bodies; retrying will not help."""
 
 
 class CircuitBreaker:
     """Minimal circuit breaker implementation."""
 
+    __slots__ = ("config", "_failures", "_open_until", "_lock")
+
     def __init__(self, config: ResilienceConfig) -> None:
         self.config = config
-        self.state = _CircuitBreakerState()
+        self._failures = 0
+        self._open_until = 0.0
+        # Clients are shared across requests, so every state transition runs
+        # under the lock.
+        self._lock = threading.Lock()
 
     def allow(self) -> None:
-        now = time.monotonic()
-        if self.state.open_until and now < self.state.open_until:
-            raise CircuitOpenError("Circuit breaker is open; skipping call.")
-        if self.state.open_until and now >= self.state.open_until:
-            self.state = _CircuitBreakerState()
+        """Raise :class:`CircuitOpenError` while open; reset once the timeout passed."""
+
+        with self._lock:
+            if not self._open_until:
+                return
+            if time.monotonic() < self._open_until:
+                raise CircuitOpenError("Circuit breaker is open; skipping call.")
+            self._failures = 0
+            self._open_until = 0.0
 
     def record_success(self) -> None:
-        self.state = _CircuitBreakerState()
+        with self._lock:
+            self._failures = 0
 
     def record_failure(self) -> None:
-        self.state.failures += 1
-        if self.state.failures >= self.config.circuit_breaker_failure_threshold:
-            self.state.open_until = (
-                time.monotonic() + self.config.circuit_breaker_reset_timeout
-            )
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.config.circuit_breaker_failure_threshold:
+                self._open_until = (
+                    time.monotonic() + self.config.circuit_breaker_reset_timeout
+                )
+
+
+_RETRYABLE_ERRORS: Tuple[type, ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    TransientHttpError,
+)
+if grpc is not None:  # pragma: no branch - depends on optional dependency
+    _RETRYABLE_ERRORS += (grpc.RpcError,)
 
 
 class Retryable(Protocol):
-    def __call__(self) -> Any:  # pragma: no cover - typing protocol
+    def __call__(self, *args: Any) -> Any:  # pragma: no cover - typing protocol
         ...
 
 
@@ -67,44 +140,87 @@ class IntegrationClient:
         self.config = config
         self.breaker = CircuitBreaker(config.resilience)
 
-    def _execute(self, operation: Retryable) -> Any:
+    def _execute(self, operation: Retryable, *args: Any) -> Any:
         attempts = 0
         delay = self.config.resilience.backoff_factor
         max_attempts = max(1, self.config.resilience.max_attempts)
         max_backoff = max(delay, self.config.resilience.max_backoff)
 
+        breaker = self.breaker
         while True:
-            self.breaker.allow()
+            breaker.allow()
             try:
-                result = operation()
-            except CircuitOpenError:
+                result = operation(*args)
+            except (CircuitOpenError, InvalidResponseError):
+                # The service answered; a rejected request is not an outage.
                 raise
-            except Exception as exc:  # pragma: no cover - generic fallback
-                self.breaker.record_failure()
+            except _RETRYABLE_ERRORS as exc:
+                breaker.record_failure()
                 attempts += 1
                 if attempts >= max_attempts:
                     raise IntegrationError(str(exc)) from exc
-                time.sleep(delay)
+                # Jitter spreads retries so workers don't hammer in lockstep.
+                time.sleep(delay * (0.5 + random.random()))
                 delay = min(delay * 2, max_backoff)
+            except Exception as exc:
+                # Unexpected errors (bad payloads, programming errors) are not
+                # going to succeed on a retry; fail fast.
+                breaker.record_failure()
+                raise IntegrationError(str(exc)) from exc
             else:
-                self.breaker.record_success()
+                breaker.record_success()
                 return result
 
 
+@lru_cache(maxsize=256)
+def _join_url(base_url: str, path: str) -> str:
+    """Resolve ``path`` against ``base_url``; clients reuse a small set of paths."""
+
+    if path.startswith(("http://", "https://")):
+        return path
+    return f"{base_url}/{path.lstrip('/')}"
+
+
 class HttpClient(IntegrationClient):
     """HTTP client with retry/backoff semantics."""
 
     def __init__(self, config: ServiceConfig, session: Optional[requests.Session] = None) -> None:
         super().__init__(config)
-        self.session = session or requests.Session()
+        self.session = session or _SHARED_SESSION
+        base_headers = {"Content-Type": "application/json"}
+        if config.secret:
+            base_headers["Authorization"] = f"Bearer {config.secret}"
+        self._base_headers: Mapping[str, str] = MappingProxyType(base_headers)
+        self._base_url = config.base_url.rstrip("/")
+
+    def _headers(self, extra: Optional[Dict[str, str]] = None) -> Mapping[str, str]:
+        # Transports merge headers into their own mapping, so the shared
+        # read-only base headers can be handed over as-is when no extra
+        # headers are supplied.
+        if not extra:
+            return self._base_headers
+        return {**self._base_headers, **extra}
 
-    def _headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self.config.secret:
-            headers["Authorization"] = f"Bearer {self.config.secret}"
-        if extra:
-            headers.update(extra)
-        return headers
+    def _build_url(self, path: str) -> str:
+        return _join_url(self._base_url, path)
+
+    @staticmethod
+    def _parse_response(url: str, response: Any) -> Dict[str, Any]:
+        """Decode a ``requests`` response or raise ``IntegrationError``."""
+
+        content = response.content
+        status = response.status_code
+        if status >= 400:
+            error = TransientHttpError if status >= 500 or status == 429 else InvalidResponseError
+            raise error(f"HTTP {status} error calling {url}: {_preview(content)}")
+        if not content:
+            return {}
+        try:
+            return _loads(content)
+        except json.JSONDecodeError:  # orjson's error subclasses this one
+            raise InvalidResponseError(
+                f"Invalid JSON payload received from {url}: {_preview(content)}"
+            )
 
     def request(
         self,
@@ -115,38 +231,51 @@ class HttpClient(IntegrationClient):
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        url = self._build_url(path)
-
-        def _call() -> Dict[str, Any]:
-            response = self.session.request(
-                method,
-                url,
-                json=json_payload,
-                params=params,
-                headers=self._headers(headers),
-                timeout=self.config.timeout,
-            )
-            if response.status_code >= 400:
-                raise IntegrationError(
-                    f"HTTP {response.status_code} error calling {url}: {response.text}"
-                )
-            if not response.content:
-                return {}
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                raise IntegrationError(
-                    f"Invalid JSON payload received from {url}: {response.text}"
-                )
+        return self._request_url(
+            method,
+            self._build_url(path),
+            json_payload=json_payload,
+            params=params,
+            headers=headers,
+        )
+
+    def _request_url(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Issue a request against an already resolved absolute ``url``."""
 
-        return self._execute(_call)
+        try:
+            body = _dumps(json_payload) if json_payload is not None else None
+        except (TypeError, ValueError) as exc:  # orjson.JSONEncodeError is a TypeError
+            raise IntegrationError(f"Payload for {url} is not JSON serialisable: {exc}") from exc
+        return self._execute(
+            self._send, method, url, body, params, self._headers(headers)
+        )
 
-    def _build_url(self, path: str) -> str:
-        if path.startswith("http://") or path.startswith("https://"):
-            return path
-        base = self.config.base_url.rstrip("/")
-        suffix = path.lstrip("/")
-        return f"{base}/{suffix}"
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        headers: Mapping[str, str],
+    ) -> Dict[str, Any]:
+        # The Content-Type header is always provided by ``_headers``.
+        response = self.session.request(
+            method,
+            url,
+            data=body,
+            params=params,
+            headers=headers,
+            timeout=self.config.timeout,
+        )
+        return self._parse_response(url, response)
 
 
 class GrpcClient(IntegrationClient):
@@ -158,24 +287,34 @@ class GrpcClient(IntegrationClient):
         super().__init__(config)
         target = config.base_url
         self.channel = channel or grpc.insecure_channel(target)
+        self._stubs: Dict[str, Any] = {}
 
-    def call_unary_unary(
+    def _stub(
         self,
         method: str,
-        request: Any,
-        *,
         request_serializer: Callable[[Any], bytes],
         response_deserializer: Callable[[bytes], Any],
     ) -> Any:
-        def _call() -> Any:
-            stub = self.channel.unary_unary(
+        # Stubs are bound once per method; serializers are fixed per RPC.
+        stub = self._stubs.get(method)
+        if stub is None:
+            stub = self._stubs[method] = self.channel.unary_unary(
                 method,
                 request_serializer=request_serializer,
                 response_deserializer=response_deserializer,
             )
-            return stub(request, timeout=self.config.timeout)
+        return stub
 
-        return self._execute(_call)
+    def call_unary_unary(
+        self,
+        method: str,
+        request: Any,
+        *,
+        request_serializer: Callable[[Any], bytes],
+        response_deserializer: Callable[[bytes], Any],
+    ) -> Any:
+        stub = self._stub(method, request_serializer, response_deserializer)
+        return self._execute(stub, request, self.config.timeout)
 
 
 def build_http_client(service_name: str, session: Optional[requests.Session] = None) -> HttpClient:
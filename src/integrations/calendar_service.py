@@ -20,10 +20,11 @@ class CalendarServiceClient(HttpClient):
         if config is None:
             config = get_service_config("calendar_service")
         super().__init__(config, session=session)
+        self._sync_url = self._build_url("calendars/sync")
+        self._calendars_prefix = self._build_url("calendars/")
 
     def sync_event(self, event_payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.request("POST", "calendars/sync", json_payload=event_payload)
+        return self._request_url("POST", self._sync_url, json_payload=event_payload)
 
     def remove_event(self, external_id: str) -> Dict[str, Any]:
-        return self.request("DELETE", f"calendars/{external_id}")
-
+        return self._request_url("DELETE", self._calendars_prefix + external_id)
@@ -20,7 +20,7 @@ class EmailServiceClient(HttpClient):
         if config is None:
             config = get_service_config("email_service")
         super().__init__(config, session=session)
+        self._notify_url = self._build_url("notifications/send")
 
     def send_notification(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.request("POST", "notifications/send", json_payload=payload)
-
+        return self._request_url("POST", self._notify_url, json_payload=payload)
@@ -1,12 +1,14 @@
 """Client for interacting with the matching service via gRPC."""
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, Optional
 
 from src.config import ServiceConfig, get_service_config
 
-from .base import GrpcClient
+from .base import GrpcClient, _dumps, _loads
+
+_FIND_MATCHES = "/matching.MatchService/FindMatches"
+_RECORD_FEEDBACK = "/matching.MatchService/RecordFeedback"
 
 
 class MatchingServiceClient:
@@ -25,20 +27,20 @@ class MatchingServiceClient:
     def find_matches_for_event(self, event_id: int, *, limit: int = 10) -> Dict[str, Any]:
         payload = {"event_id": event_id, "limit": limit}
         response = self.client.call_unary_unary(
-            "/matching.MatchService/FindMatches",
+            _FIND_MATCHES,
             payload,
-            request_serializer=lambda data: json.dumps(data).encode("utf-8"),
-            response_deserializer=lambda data: json.loads(data.decode("utf-8")),
+            request_serializer=_dumps,
+            response_deserializer=_loads,
         )
         return response
 
     def record_feedback(self, event_id: int, attendee_id: str, score: int) -> Dict[str, Any]:
         payload = {"event_id": event_id, "attendee_id": attendee_id, "score": score}
         response = self.client.call_unary_unary(
-            "/matching.MatchService/RecordFeedback",
+            _RECORD_FEEDBACK,
             payload,
-            request_serializer=lambda data: json.dumps(data).encode("utf-8"),
-            response_deserializer=lambda data: json.loads(data.decode("utf-8")),
+            request_serializer=_dumps,
+            response_deserializer=_loads,
         )
         return response
 
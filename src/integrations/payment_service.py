@@ -20,6 +20,8 @@ class PaymentServiceClient(HttpClient):
         if config is None:
             config = get_service_config("payment_service")
         super().__init__(config, session=session)
+        self._capture_url = self._build_url("payments/capture")
+        self._payments_prefix = self._build_url("payments/")
 
     def capture_payment(
         self,
@@ -37,16 +39,16 @@ class PaymentServiceClient(HttpClient):
             "currency": currency,
             "metadata": metadata or {},
         }
-        return self.request("POST", "payments/capture", json_payload=payload)
+        return self._request_url("POST", self._capture_url, json_payload=payload)
 
     def refund_payment(self, payment_id: str, *, reason: Optional[str] = None) -> Dict[str, Any]:
         payload = {"reason": reason} if reason else None
-        return self.request(
+        return self._request_url(
             "POST",
-            f"payments/{payment_id}/refund",
+            f"{self._payments_prefix}{payment_id}/refund",
             json_payload=payload,
         )
 
     def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
-        return self.request("GET", f"payments/{payment_id}")
+        return self._request_url("GET", self._payments_prefix + payment_id)
 
@@ -20,11 +20,12 @@ class SocialServiceClient(HttpClient):
         if config is None:
             config = get_service_config("social_service")
         super().__init__(config, session=session)
+        self._exchange_url = self._build_url("oauth/exchange")
+        self._share_url = self._build_url("shares/event")
 
     def exchange_token(self, provider: str, code: str, redirect_uri: str) -> Dict[str, Any]:
         payload = {"provider": provider, "code": code, "redirect_uri": redirect_uri}
-        return self.request("POST", "oauth/exchange", json_payload=payload)
+        return self._request_url("POST", self._exchange_url, json_payload=payload)
 
     def publish_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.request("POST", "shares/event", json_payload=payload)
-
+        return self._request_url("POST", self._share_url, json_payload=payload)
@@ -1,7 +1,11 @@
 """Client for interacting with the user service REST API."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import copy
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from cachetools import TTLCache
 
 from src.config import ServiceConfig, get_service_config
 
@@ -16,20 +20,55 @@ class UserServiceClient(HttpClient):
         *,
         config: Optional[ServiceConfig] = None,
         session: Optional["requests.Session"] = None,
+        cache_size: int = 1024,
+        cache_ttl: float = 30.0,
     ) -> None:
         if config is None:
             config = get_service_config("user_service")
         super().__init__(config, session=session)
+        self._users_prefix = self._build_url("users/")
+        self._search_url = self._build_url("users/search")
+        # Profiles and search results are read far more often than they change,
+        # so short-lived exact-match caches absorb most of the round-trips.
+        # Callers get deep copies, so mutating a result never leaks into the
+        # cache; TTLCache is not thread-safe, hence the lock.
+        self._cache_lock = threading.Lock()
+        self._profile_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl
+        )
+        self._search_cache: TTLCache[Tuple[str, int], Dict[str, Any]] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl
+        )
 
     def get_user_profile(self, user_id: str) -> Dict[str, Any]:
-        response = self.request("GET", f"users/{user_id}")
-        return response.get("data", response)
+        with self._cache_lock:
+            cached = self._profile_cache.get(user_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        response = self._request_url("GET", self._users_prefix + user_id)
+        profile = response.get("data", response)
+        with self._cache_lock:
+            self._profile_cache[user_id] = profile
+        return copy.deepcopy(profile)
 
     def update_preferences(self, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.request("PUT", f"users/{user_id}/preferences", json_payload=payload)
+        response = self._request_url(
+            "PUT",
+            f"{self._users_prefix}{user_id}/preferences",
+            json_payload=payload,
+        )
+        with self._cache_lock:
+            self._profile_cache.pop(user_id, None)
         return response.get("data", response)
 
     def search(self, query: str, *, limit: int = 25) -> Dict[str, Any]:
+        key = (query, limit)
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
         params = {"q": query, "limit": limit}
-        return self.request("GET", "users/search", params=params)
-
+        result = self._request_url("GET", self._search_url, params=params)
+        with self._cache_lock:
+            self._search_cache[key] = result
+        return copy.deepcopy(result)
@@ -1,14 +1,30 @@
 """Meetinity Event Service application entrypoint."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+if __name__ == "__main__":  # pragma: no cover - dev server only
+    # Under gunicorn the gevent worker patches the stdlib itself; the dev
+    # server has to do it before anything else imports sockets or threads.
+    try:
+        from gevent import monkey
+
+        monkey.patch_all()
+    except ModuleNotFoundError:
+        pass
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from flask import Flask, g, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 try:
     from flask_socketio import SocketIO, emit, join_room, leave_room
+    from socketio import PubSubManager as _PubSubManager
 except ModuleNotFoundError:  # pragma: no cover - fallback for offline environments
+    _PubSubManager = None
     class SocketIO:  # type: ignore[override]
         def __init__(self, *args, **kwargs):
             self._handlers = {}
@@ -26,6 +42,12 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for offline environme
         def emit(self, *args, **kwargs):
             return None
 
+        def start_background_task(self, *args, **kwargs):
+            return None
+
+        def run(self, flask_app, **kwargs):
+            flask_app.run(**kwargs)
+
     def emit(*args, **kwargs):  # type: ignore[misc]
         return None
 
@@ -35,11 +57,20 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for offline environme
     def leave_room(*args, **kwargs):  # type: ignore[misc]
         return None
 
-from src.database import get_session, init_engine
+from src.database import init_engine, scoped_db_session
 from src.routes import register_blueprints
-from src.routes.dependencies import cleanup_services
-from src.routes.utils import error_response
-from src.services.events import EventNotFoundError, EventService, ValidationError
+from src.routes.dependencies import cleanup_services, get_event_service
+from src.routes.utils import (
+    OrjsonCodec,
+    OrjsonProvider,
+    error_response,
+    json_body_error,
+    orjson,
+    static_error_response,
+    stream_json_list,
+)
+from src.services.event_cache import cache_event, get_cached_event
+from src.services.events import EventNotFoundError, ValidationError
 from src.services.registrations import (
     CheckInError,
     DuplicateRegistrationError,
@@ -49,186 +80,305 @@ from src.services.registrations import (
 )
 
 app = Flask(__name__)
-socketio = SocketIO(cors_allowed_origins="*")
-_SOCKET_HANDLERS_REGISTERED = False
+socketio = SocketIO(
+    cors_allowed_origins="*",
+    async_mode=os.getenv("SOCKETIO_ASYNC_MODE") or None,
+)
+_MAX_CONTENT_LENGTH = 256 * 1024
+_EVENT_NOT_FOUND = static_error_response(404, "Événement introuvable.")
+_NOT_FOUND = static_error_response(404, "Ressource introuvable.")
+_METHOD_NOT_ALLOWED = static_error_response(
+    405, "Méthode non autorisée pour cette ressource."
+)
+_PAYLOAD_TOO_LARGE = static_error_response(413, "Payload trop volumineux.")
+_INTERNAL_ERROR = static_error_response(500, "Erreur interne. On respire, on relance.")
+# Chat and agenda messages are coalesced per room and flushed after this delay.
+_BROADCAST_FLUSH_DELAY = 0.01
+_PENDING_BROADCASTS: Dict[Tuple[str, str], List[dict]] = {}
+_PENDING_BROADCASTS_LOCK = threading.Lock()
 
 
 def create_app() -> Flask:
     init_engine()
+    # Bounds every request body; oversized payloads are rejected with a 413
+    # before they are read and parsed.
+    if app.config.get("MAX_CONTENT_LENGTH") is None:
+        app.config["MAX_CONTENT_LENGTH"] = _MAX_CONTENT_LENGTH
     register_blueprints(app)
     app.teardown_appcontext(cleanup_services)
     register_error_handlers(app)
-    socketio.init_app(app, cors_allowed_origins="*")
-    _register_socketio_handlers()
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    # With REDIS_URL set, room broadcasts are published once through Redis
+    # and delivered by every worker instead of only the emitting process.
+    socketio.init_app(
+        app,
+        cors_allowed_origins="*",
+        message_queue=os.getenv("REDIS_URL") or None,
+        json=OrjsonCodec if orjson is not None else None,
+    )
     return app
 
 
-def get_event_service() -> EventService:
-    """Return a lazily initialised :class:`EventService` for the request."""
-
-    if "db_session" not in g:
-        g.db_session = get_session()
-    if "event_service" not in g:
-        g.event_service = EventService(g.db_session)
-    return g.event_service
+# Services are stateless apart from their session, so one instance of each is
+# built at import and bound to the scoped session registry. The event service
+# is shared with the blueprints through ``src.routes.dependencies``.
+REGISTRATION_SERVICE = RegistrationService(scoped_db_session)
 
 
 def get_registration_service() -> RegistrationService:
-    """Return a lazily initialised :class:`RegistrationService`."""
+    """Return the shared :class:`RegistrationService`."""
 
-    if "db_session" not in g:
-        g.db_session = get_session()
-    if "registration_service" not in g:
-        g.registration_service = RegistrationService(g.db_session)
-    return g.registration_service
+    return REGISTRATION_SERVICE
 
 
-@app.teardown_appcontext
-def shutdown_session(exception):
-    """Ensure the SQLAlchemy session is properly closed after each request."""
+@contextmanager
+def _released_session() -> Iterator[None]:
+    """Return the scoped session to the pool as soon as the block exits.
 
-    session = g.pop("db_session", None)
-    g.pop("event_service", None)
-    g.pop("registration_service", None)
-    if session is not None:
-        try:
-            if exception is not None:
-                session.rollback()
-        finally:
-            session.close()
+    The services hand back plain dicts, so response serialisation does not
+    need to hold a pooled connection until teardown.
+    """
+
+    try:
+        yield
+    finally:
+        scoped_db_session.remove()
+
+
+_HEALTH_BODY = b'{"status":"ok","service":"event-service"}'
 
 
 @app.get("/health")
 def health():
-    return {"status": "ok", "service": "event-service"}
+    # Probed every few seconds by orchestrators: hand back the fixed body
+    # without building and encoding a dict each time.
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 def register_error_handlers(flask_app: Flask) -> None:
     @flask_app.errorhandler(404)
     def handle_404(e):
-        return error_response(404, "Ressource introuvable.")
+        return _NOT_FOUND()
 
     @flask_app.errorhandler(405)
     def handle_405(e):
-        return error_response(405, "Méthode non autorisée pour cette ressource.")
+        return _METHOD_NOT_ALLOWED()
+
+    @flask_app.errorhandler(413)
+    def handle_413(e):
+        return _PAYLOAD_TOO_LARGE()
 
     @flask_app.errorhandler(500)
     def handle_500(e):
-        return error_response(500, "Erreur interne. On respire, on relance.")
+        return _INTERNAL_ERROR()
 
 
-def _register_socketio_handlers() -> None:
-    global _SOCKET_HANDLERS_REGISTERED
-    if _SOCKET_HANDLERS_REGISTERED:
-        return
-
-    @socketio.on("join_event")
-    def handle_join_event(data):  # type: ignore[misc]
-        event_id = _extract_event_id(data)
-        if event_id is None:
-            emit(
-                "event:error",
-                {"message": "event_id requis pour rejoindre un canal."},
-            )
-            return
-        room = _event_room(event_id)
-        join_room(room)
+@socketio.on("join_event")
+def handle_join_event(data):
+    event_ids = _extract_event_ids(data)
+    if not event_ids:
         emit(
-            "event:presence",
-            {
-                "event_id": event_id,
-                "type": "join",
-                "user": (data or {}).get("user"),
-                "timestamp": _timestamp(),
-            },
-            room=room,
+            "event:error",
+            {"message": "event_id requis pour rejoindre un canal."},
         )
-
-    @socketio.on("leave_event")
-    def handle_leave_event(data):  # type: ignore[misc]
-        event_id = _extract_event_id(data)
-        if event_id is None:
-            return
-        room = _event_room(event_id)
-        leave_room(room)
-        emit(
-            "event:presence",
-            {
-                "event_id": event_id,
-                "type": "leave",
-                "user": (data or {}).get("user"),
-                "timestamp": _timestamp(),
-            },
-            room=room,
-        )
-
-    @socketio.on("send_announcement")
-    def handle_send_announcement(data):  # type: ignore[misc]
-        if not isinstance(data, dict):
-            return
-        payload = {
-            "event_id": data.get("event_id"),
-            "message": data.get("message"),
-            "title": data.get("title"),
-            "timestamp": _timestamp(),
-        }
-        event_id = _extract_event_id(data)
-        if event_id is None:
-            socketio.emit("event:announcement", payload)
-        else:
-            emit("event:announcement", payload, room=_event_room(event_id))
-
-    @socketio.on("agenda_notification")
-    def handle_agenda_notification(data):  # type: ignore[misc]
-        if not isinstance(data, dict):
-            return
-        event_id = _extract_event_id(data)
-        if event_id is None:
-            return
-        payload = {
+        return
+    # Join every room in one handler call so the message queue can
+    # subscribe to all of them together.
+    rooms = [_event_room(event_id) for event_id in event_ids]
+    for room in rooms:
+        join_room(room)
+    payload = {
+        "type": "join",
+        "user": data.get("user"),
+        "timestamp": _timestamp(),
+    }
+    # The joiner already knows it joined; skipping it saves a packet and,
+    # with a message queue, a loopback delivery to this worker.
+    if len(event_ids) == 1:
+        payload["event_id"] = event_ids[0]
+        emit("event:presence", payload, room=rooms[0], include_self=False)
+    else:
+        payload["event_ids"] = event_ids
+        emit("event:presence", payload, room=rooms, include_self=False)
+
+
+@socketio.on("leave_event")
+def handle_leave_event(data):
+    event_id = _extract_event_id(data)
+    if event_id is None:
+        return
+    room = _event_room(event_id)
+    leave_room(room)
+    emit(
+        "event:presence",
+        {
             "event_id": event_id,
-            "slot": data.get("slot"),
-            "message": data.get("message"),
+            "type": "leave",
+            "user": (data or {}).get("user"),
             "timestamp": _timestamp(),
-        }
-        emit("event:agenda", payload, room=_event_room(event_id))
+        },
+        room=room,
+    )
 
-    @socketio.on("chat_message")
-    def handle_chat_message(data):  # type: ignore[misc]
-        if not isinstance(data, dict):
-            return
-        event_id = _extract_event_id(data)
-        if event_id is None or not data.get("message"):
-            return
-        payload = {
-            "event_id": event_id,
-            "user": data.get("user"),
-            "message": data.get("message"),
-            "timestamp": _timestamp(),
-        }
-        emit("event:chat", payload, room=_event_room(event_id))
 
-    _SOCKET_HANDLERS_REGISTERED = True
+@socketio.on("send_announcement")
+def handle_send_announcement(data):
+    if not isinstance(data, dict):
+        return
+    event_id = _extract_event_id(data)
+    room = None if event_id is None else _event_room(event_id)
+    if room is not None and _room_is_empty(room):
+        return
+    payload = {
+        "event_id": data.get("event_id"),
+        "message": data.get("message"),
+        "title": data.get("title"),
+        "timestamp": _timestamp(),
+    }
+    if room is None:
+        socketio.emit("event:announcement", payload)
+    else:
+        emit("event:announcement", payload, room=room)
+
+
+@socketio.on("agenda_notification")
+def handle_agenda_notification(data):
+    if not isinstance(data, dict):
+        return
+    event_id = _extract_event_id(data)
+    if event_id is None:
+        return
+    room = _event_room(event_id)
+    if _room_is_empty(room):
+        return
+    payload = {
+        "event_id": event_id,
+        "slot": data.get("slot"),
+        "message": data.get("message"),
+        "timestamp": _timestamp(),
+    }
+    _queue_broadcast("event:agenda", room, payload)
+
+
+@socketio.on("chat_message")
+def handle_chat_message(data):
+    if not isinstance(data, dict):
+        return
+    event_id = _extract_event_id(data)
+    if event_id is None or not data.get("message"):
+        return
+    room = _event_room(event_id)
+    if _room_is_empty(room):
+        return
+    payload = {
+        "event_id": event_id,
+        "user": data.get("user"),
+        "message": data.get("message"),
+        "timestamp": _timestamp(),
+    }
+    _queue_broadcast("event:chat", room, payload)
 
 
 def _extract_event_id(data) -> Optional[int]:
     if not isinstance(data, dict):
         return None
-    event_id = data.get("event_id")
-    if isinstance(event_id, int):
+    return _coerce_event_id(data.get("event_id"))
+
+
+def _coerce_event_id(event_id) -> Optional[int]:
+    # Clients mostly send ids as JSON strings. ``isdecimal`` only admits plain
+    # digit strings, so padded or signed forms such as " 12" or "+3", which
+    # ``int`` would parse, are rejected, and no exception is raised. ``bool``
+    # is an ``int`` subclass but is never an id.
+    if isinstance(event_id, int) and not isinstance(event_id, bool):
         return event_id
-    try:
+    if isinstance(event_id, str) and event_id.isdecimal():
         return int(event_id)
-    except (TypeError, ValueError):
-        return None
+    return None
+
+
+def _extract_event_ids(data) -> List[int]:
+    """Return the event ids from ``event_ids`` (list) or a single ``event_id``."""
+
+    if not isinstance(data, dict):
+        return []
+    raw_ids = data.get("event_ids")
+    if not isinstance(raw_ids, list):
+        event_id = _extract_event_id(data)
+        return [] if event_id is None else [event_id]
+    event_ids: List[int] = []
+    for raw in raw_ids:
+        event_id = _coerce_event_id(raw)
+        if event_id is not None and event_id not in event_ids:
+            event_ids.append(event_id)
+    return event_ids
 
 
+@lru_cache(maxsize=4096)
 def _event_room(event_id: int) -> str:
     return f"event-{event_id}"
 
 
+def _room_is_empty(room: str, namespace: str = "/") -> bool:
+    """Return ``True`` when no local socket has joined ``room``.
+
+    With a message queue other workers may hold subscribers, so the room is
+    never considered empty in that case.
+    """
+
+    server = getattr(socketio, "server", None)
+    if server is None:
+        return False
+    manager = server.manager
+    if _PubSubManager is not None and isinstance(manager, _PubSubManager):
+        return False
+    return not manager.rooms.get(namespace, {}).get(room)
+
+
+def _queue_broadcast(event: str, room: str, payload: dict) -> None:
+    """Buffer ``payload`` and broadcast it to ``room`` as part of a batch.
+
+    The first payload for an ``(event, room)`` pair schedules a flush; any
+    payload arriving before it joins the same ``<event>_batch`` emit. Each
+    payload is also still emitted on its own as ``event`` so existing
+    subscribers keep working while clients move to the batch event.
+    """
+
+    key = (event, room)
+    with _PENDING_BROADCASTS_LOCK:
+        pending = _PENDING_BROADCASTS.get(key)
+        if pending is not None:
+            pending.append(payload)
+            return
+        _PENDING_BROADCASTS[key] = [payload]
+    socketio.start_background_task(_flush_broadcast, key)
+
+
+def _flush_broadcast(key: Tuple[str, str]) -> None:
+    socketio.sleep(_BROADCAST_FLUSH_DELAY)
+    with _PENDING_BROADCASTS_LOCK:
+        payloads = _PENDING_BROADCASTS.pop(key, [])
+    event, room = key
+    # Deprecated per-message form, kept until clients consume the batches.
+    for payload in payloads:
+        socketio.emit(event, payload, to=room)
+    socketio.emit(f"{event}_batch", payloads, to=room)
+
+
+_TIMESTAMP_PREFIX = (-1, "")
+
+
 def _timestamp() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    # Socket handlers stamp every emit; the date/time part only changes once
+    # per second, so it is formatted once and reused with a fresh fraction.
+    global _TIMESTAMP_PREFIX
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _TIMESTAMP_PREFIX
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _TIMESTAMP_PREFIX = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}Z"
 
 
 @app.route("/events", methods=["POST"])
@@ -247,14 +397,9 @@ def create_event():
     Returns:
         Response: JSON response with created event details.
     """
-    if not request.is_json:
-        return error_response(
-            415, "Content-Type 'application/json' requis."
-        )
-
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     if not isinstance(data, dict):
         return error_response(
@@ -287,12 +432,13 @@ def get_event(event_id):
     Returns:
         Response: JSON response with event details.
     """
-    service = get_event_service()
-
-    try:
-        event = service.get_event(event_id)
-    except EventNotFoundError:
-        return error_response(404, "Événement introuvable.")
+    event = get_cached_event(event_id)
+    if event is None:
+        try:
+            event = get_event_service().get_event(event_id)
+        except EventNotFoundError:
+            return _EVENT_NOT_FOUND()
+        cache_event(event_id, event)
 
     return jsonify({"event": event})
 
@@ -301,12 +447,9 @@ def get_event(event_id):
 def update_event(event_id):
     """Partially update an existing event."""
 
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
-
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     if not isinstance(data, dict):
         return error_response(
@@ -319,44 +462,72 @@ def update_event(event_id):
     try:
         updated_event = service.update_event(event_id, data)
     except EventNotFoundError:
-        return error_response(404, "Événement introuvable.")
+        return _EVENT_NOT_FOUND()
     except ValidationError as exc:
         return error_response(422, exc.message, exc.errors)
 
     return jsonify({"message": "Event updated", "event": updated_event})
 
 
-@app.route("/events/<int:event_id>/registrations", methods=["GET", "POST"])
-def manage_registrations(event_id: int):
-    service = get_registration_service()
+_MAX_PAGE_SIZE = 500
 
-    if request.method == "GET":
-        try:
-            registrations = service.list_registrations(event_id)
-        except LookupError:
-            return error_response(404, "Événement introuvable.")
-        return jsonify({"registrations": registrations})
 
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
+def _keyset_args() -> dict:
+    """Read the optional ``after_id``/``limit`` keyset pagination parameters.
+
+    ``limit`` must be positive and is capped at ``_MAX_PAGE_SIZE``.
+    """
+
+    limit = request.args.get("limit", type=int)
+    if limit is not None:
+        if limit < 1:
+            raise ValidationError({"limit": ["Doit être un entier positif."]})
+        limit = min(limit, _MAX_PAGE_SIZE)
+    return {
+        "after_id": request.args.get("after_id", type=int),
+        "limit": limit,
+    }
 
-    data = request.get_json(silent=True) or {}
+
+@app.get("/events/<int:event_id>/registrations")
+def list_registrations(event_id: int):
+    try:
+        registrations = get_registration_service().iter_registrations(
+            event_id, **_keyset_args()
+        )
+    except ValidationError as exc:
+        return error_response(422, exc.message, exc.errors)
+    except LookupError:
+        return _EVENT_NOT_FOUND()
+    return stream_json_list("registrations", registrations)
+
+
+@app.post("/events/<int:event_id>/registrations")
+def create_registration(event_id: int):
+    service = get_registration_service()
+
+    data = request.get_json(silent=True)
+    if data is None:
+        return json_body_error()
+    if not isinstance(data, dict):
+        data = {}
     email = data.get("email")
     name = data.get("name")
-    metadata = data.get("metadata") if isinstance(data, dict) else None
+    metadata = data.get("metadata")
 
     if not isinstance(email, str) or not email.strip():
         return error_response(422, "Validation échouée.", {"email": ["Adresse requise."]})
 
     try:
-        result = service.register_attendee(
-            event_id,
-            email=email,
-            full_name=name if isinstance(name, str) else None,
-            metadata=metadata if isinstance(metadata, dict) else None,
-        )
+        with _released_session():
+            result = service.register_attendee(
+                event_id,
+                email=email,
+                full_name=name if isinstance(name, str) else None,
+                metadata=metadata if isinstance(metadata, dict) else None,
+            )
     except LookupError:
-        return error_response(404, "Événement introuvable.")
+        return _EVENT_NOT_FOUND()
     except RegistrationClosedError as exc:
         return error_response(409, str(exc))
     except DuplicateRegistrationError as exc:
@@ -380,37 +551,43 @@ def cancel_registration(event_id: int, registration_id: int):
     return jsonify({"message": "Registration cancelled", **result})
 
 
-@app.route("/events/<int:event_id>/waitlist", methods=["GET", "POST"])
-def manage_waitlist(event_id: int):
-    service = get_registration_service()
-    if request.method == "GET":
-        try:
-            waitlist = service.list_waitlist(event_id)
-        except LookupError:
-            return error_response(404, "Événement introuvable.")
-        return jsonify({"waitlist": waitlist})
+@app.get("/events/<int:event_id>/waitlist")
+def list_waitlist(event_id: int):
+    try:
+        waitlist = get_registration_service().iter_waitlist(event_id, **_keyset_args())
+    except ValidationError as exc:
+        return error_response(422, exc.message, exc.errors)
+    except LookupError:
+        return _EVENT_NOT_FOUND()
+    return stream_json_list("waitlist", waitlist)
 
+
+@app.post("/events/<int:event_id>/waitlist")
+def promote_waitlist(event_id: int):
     try:
-        promoted = service.trigger_waitlist_promotion(event_id)
+        promoted = get_registration_service().trigger_waitlist_promotion(event_id)
     except LookupError:
-        return error_response(404, "Événement introuvable.")
+        return _EVENT_NOT_FOUND()
     return jsonify({"promoted": promoted})
 
 
-@app.route("/events/<int:event_id>/attendance", methods=["GET", "POST"])
-def manage_attendance(event_id: int):
-    service = get_registration_service()
-    if request.method == "GET":
-        try:
-            attendance = service.list_attendance(event_id)
-        except LookupError:
-            return error_response(404, "Événement introuvable.")
-        return jsonify({"attendance": attendance})
+@app.get("/events/<int:event_id>/attendance")
+def list_attendance(event_id: int):
+    try:
+        attendance = get_registration_service().iter_attendance(event_id, **_keyset_args())
+    except ValidationError as exc:
+        return error_response(422, exc.message, exc.errors)
+    except LookupError:
+        return _EVENT_NOT_FOUND()
+    return stream_json_list("attendance", attendance)
+
 
+@app.post("/events/<int:event_id>/attendance")
+def detect_no_shows(event_id: int):
     try:
-        result = service.detect_no_shows(event_id)
+        result = get_registration_service().detect_no_shows(event_id)
     except LookupError:
-        return error_response(404, "Événement introuvable.")
+        return _EVENT_NOT_FOUND()
     return jsonify(result)
 
 
@@ -419,19 +596,22 @@ def check_in(token: str):
     service = get_registration_service()
     metadata = None
     method = "qr"
-    if request.is_json:
-        payload = request.get_json(silent=True) or {}
-        if isinstance(payload, dict):
-            metadata = payload.get("metadata") if isinstance(payload.get("metadata"), dict) else None
-            method_value = payload.get("method")
-            if isinstance(method_value, str) and method_value.strip():
-                method = method_value.strip()
+    # ``get_json`` already returns None for non-JSON bodies.
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict):
+        metadata_value = payload.get("metadata")
+        if isinstance(metadata_value, dict):
+            metadata = metadata_value
+        method_value = payload.get("method")
+        if isinstance(method_value, str) and method_value.strip():
+            method = method_value.strip()
     try:
-        result = service.check_in_attendee(token, method=method, metadata=metadata)
+        with _released_session():
+            result = service.check_in_attendee(token, method=method, metadata=metadata)
     except CheckInError as exc:
         return error_response(400, str(exc))
     except LookupError:
-        return error_response(404, "Événement introuvable.")
+        return _EVENT_NOT_FOUND()
     return jsonify({"message": "Check-in enregistré", "attendance": result})
 
 
@@ -439,4 +619,7 @@ create_app()
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5003)
+    # Debug mode adds the reloader and debugger middleware to every request;
+    # opt in explicitly with FLASK_DEBUG=1.
+    debug = os.getenv("FLASK_DEBUG", "false").lower() in {"1", "true", "yes"}
+    socketio.run(app, debug=debug, port=5003)
@@ -7,11 +7,13 @@ from typing import List, Optional
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Column,
     Date,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -19,18 +21,38 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, configure_mappers, mapped_column, relationship
 
 from src.database import Base
 
 
-class TimestampMixin:
-    """Mixin providing automatic created/updated timestamps."""
+# Documents returned with every event or template payload are stored as JSONB
+# on PostgreSQL (parsed once server-side); other backends keep plain JSON.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+# Shared by ``Event.status`` and the approval audit trail so both store the
+# same native enum rather than the log repeating the labels as text.
+EventStatus = Enum("draft", "pending", "approved", "rejected", name="event_status")
+
+
+class CreatedAtMixin:
+    """Mixin providing an automatic creation timestamp for append-only rows."""
+
+    # Fetch server-generated timestamps with RETURNING during the flush
+    # instead of expiring them and reloading on first access.
+    __mapper_args__ = {"eager_defaults": True}
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+
+class TimestampMixin(CreatedAtMixin):
+    """Mixin providing automatic created/updated timestamps."""
+
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -42,8 +64,8 @@ class TimestampMixin:
 event_categories_events = Table(
     "event_categories_events",
     Base.metadata,
-    mapped_column("event_id", ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
-    mapped_column(
+    Column("event_id", ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
+    Column(
         "category_id",
         ForeignKey("event_categories.id", ondelete="CASCADE"),
         primary_key=True,
@@ -54,8 +76,8 @@ event_categories_events = Table(
 event_tags_events = Table(
     "event_tags_events",
     Base.metadata,
-    mapped_column("event_id", ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
-    mapped_column(
+    Column("event_id", ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
+    Column(
         "tag_id", ForeignKey("event_tags.id", ondelete="CASCADE"), primary_key=True
     ),
 )
@@ -97,7 +119,7 @@ class EventTemplate(TimestampMixin, Base):
     default_locale: Mapped[str] = mapped_column(String(10), nullable=False, default="fr")
     fallback_locale: Mapped[Optional[str]] = mapped_column(String(10))
     default_capacity_limit: Mapped[Optional[int]] = mapped_column(Integer)
-    default_metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    default_metadata: Mapped[Optional[dict]] = mapped_column(JSONDocument)
 
     events: Mapped[List["Event"]] = relationship(
         "Event", back_populates="template", cascade="all, delete"
@@ -121,6 +143,10 @@ class EventSeries(TimestampMixin, Base):
     )
 
 
+# Series are looked up by name case-insensitively when events are created.
+Index("ix_event_series_name_lower", func.lower(EventSeries.name))
+
+
 class Event(TimestampMixin, Base):
     __tablename__ = "events"
     __table_args__ = (
@@ -129,11 +155,19 @@ class Event(TimestampMixin, Base):
             "capacity_limit IS NULL OR capacity_limit >= attendees",
             name="ck_events_capacity_above_attendees",
         ),
+        Index("ix_events_status_date", "status", "event_date"),
+        # Reminder and waitlist jobs only ever look at open events.
+        Index(
+            "ix_events_open_date",
+            "event_date",
+            postgresql_where=text("registration_open = true"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text)
+    # Only the calendar export reads it; listings never serialise it.
+    description: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
     event_date: Mapped[date] = mapped_column(Date, nullable=False)
     location: Mapped[Optional[str]] = mapped_column(String(255))
     event_type: Mapped[Optional[str]] = mapped_column(String(120))
@@ -143,11 +177,7 @@ class Event(TimestampMixin, Base):
         DateTime(timezone=True)
     )
     timezone: Mapped[str] = mapped_column(String(64), nullable=False, default="UTC")
-    status: Mapped[str] = mapped_column(
-        Enum("draft", "pending", "approved", "rejected", name="event_status"),
-        nullable=False,
-        default="draft",
-    )
+    status: Mapped[str] = mapped_column(EventStatus, nullable=False, default="draft")
     event_format: Mapped[str] = mapped_column(
         Enum("in_person", "virtual", "hybrid", name="event_format"),
         nullable=False,
@@ -164,7 +194,7 @@ class Event(TimestampMixin, Base):
     default_locale: Mapped[str] = mapped_column(String(10), nullable=False, default="fr")
     fallback_locale: Mapped[Optional[str]] = mapped_column(String(10))
     organizer_email: Mapped[Optional[str]] = mapped_column(String(255))
-    settings: Mapped[Optional[dict]] = mapped_column(JSON)
+    settings: Mapped[Optional[dict]] = mapped_column(JSONDocument)
     template_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("event_templates.id", ondelete="SET NULL")
     )
@@ -172,43 +202,67 @@ class Event(TimestampMixin, Base):
         ForeignKey("event_series.id", ondelete="SET NULL")
     )
 
+    # The serialised form of an event always carries its series, taxonomies
+    # and translations, so those load eagerly by default; the remaining
+    # collections stay lazy and are requested explicitly at the query site.
+    # Audit trails and penalties are never part of that payload: touching
+    # them without an explicit loader option raises instead of silently
+    # issuing one SELECT per event. Deletion relies on the ON DELETE CASCADE
+    # foreign keys rather than loading them.
     template: Mapped[Optional[EventTemplate]] = relationship(
-        "EventTemplate", back_populates="events"
+        "EventTemplate", back_populates="events", lazy="joined", innerjoin=False
     )
     series: Mapped[Optional[EventSeries]] = relationship(
-        "EventSeries", back_populates="events"
+        "EventSeries", back_populates="events", lazy="joined", innerjoin=False
     )
     categories: Mapped[List[EventCategory]] = relationship(
         "EventCategory",
         secondary=event_categories_events,
         back_populates="events",
+        lazy="selectin",
     )
     tags: Mapped[List[EventTag]] = relationship(
-        "EventTag", secondary=event_tags_events, back_populates="events"
+        "EventTag",
+        secondary=event_tags_events,
+        back_populates="events",
+        lazy="selectin",
     )
     translations: Mapped[List["EventTranslation"]] = relationship(
-        "EventTranslation", back_populates="event", cascade="all, delete-orphan"
+        "EventTranslation",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
     approvals: Mapped[List["EventApproval"]] = relationship(
-        "EventApproval", back_populates="event", cascade="all, delete-orphan"
+        "EventApproval",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     approval_logs: Mapped[List["EventApprovalLog"]] = relationship(
-        "EventApprovalLog", back_populates="event", cascade="all, delete-orphan"
+        "EventApprovalLog",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     notifications: Mapped[List["EventNotification"]] = relationship(
-        "EventNotification", back_populates="event", cascade="all, delete-orphan"
+        "EventNotification",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     registrations: Mapped[List["Registration"]] = relationship(
         "Registration",
         back_populates="event",
         cascade="all, delete-orphan",
-        order_by="Registration.created_at",
     )
     waitlist_entries: Mapped[List["WaitlistEntry"]] = relationship(
         "WaitlistEntry",
         back_populates="event",
         cascade="all, delete-orphan",
-        order_by="WaitlistEntry.created_at",
     )
     participant_profiles: Mapped[List["ParticipantProfile"]] = relationship(
         "ParticipantProfile",
@@ -240,10 +294,21 @@ class Event(TimestampMixin, Base):
         order_by="EventSponsor.display_order",
     )
     penalties: Mapped[List["NoShowPenalty"]] = relationship(
-        "NoShowPenalty", back_populates="event", cascade="all, delete-orphan"
+        "NoShowPenalty",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
+# Indexes backing the /events filters: type and location are matched
+# case-insensitively, dates by range and for ordering.
+Index("ix_events_event_date", Event.event_date)
+Index("ix_events_event_type_lower", func.lower(Event.event_type))
+Index("ix_events_location_lower", func.lower(Event.location))
+
+
 class EventTranslation(TimestampMixin, Base):
     __tablename__ = "event_translations"
     __table_args__ = (
@@ -275,27 +340,27 @@ class EventApproval(TimestampMixin, Base):
     )
     approved_by: Mapped[Optional[str]] = mapped_column(String(120))
     approved_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    notes: Mapped[Optional[str]] = mapped_column(Text)
+    notes: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
 
     event: Mapped[Event] = relationship("Event", back_populates="approvals")
 
 
-class EventApprovalLog(TimestampMixin, Base):
+class EventApprovalLog(CreatedAtMixin, Base):
     __tablename__ = "event_approval_logs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     event_id: Mapped[int] = mapped_column(
         ForeignKey("events.id", ondelete="CASCADE"), nullable=False
     )
-    previous_status: Mapped[Optional[str]] = mapped_column(String(20))
-    new_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    previous_status: Mapped[Optional[str]] = mapped_column(EventStatus)
+    new_status: Mapped[str] = mapped_column(EventStatus, nullable=False)
     actor: Mapped[Optional[str]] = mapped_column(String(120))
     notes: Mapped[Optional[str]] = mapped_column(Text)
 
     event: Mapped[Event] = relationship("Event", back_populates="approval_logs")
 
 
-class EventNotification(TimestampMixin, Base):
+class EventNotification(CreatedAtMixin, Base):
     __tablename__ = "event_notifications"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -338,6 +403,16 @@ class Registration(TimestampMixin, Base):
         UniqueConstraint(
             "event_id", "attendee_email", name="uq_registration_event_email"
         ),
+        # Capacity checks count confirmed registrations per event.
+        Index("ix_registrations_event_status", "event_id", "status"),
+        # Registrations are append-only, so created_at follows the physical
+        # row order and a BRIN range index stays tiny on PostgreSQL.
+        Index(
+            "ix_registrations_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -359,7 +434,8 @@ class Registration(TimestampMixin, Base):
     )
     check_in_token: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
     qr_code_data: Mapped[Optional[str]] = mapped_column(Text)
-    metadata: Mapped[Optional[str]] = mapped_column(Text)
+    # ``metadata`` is reserved by the declarative base; the column keeps its name.
+    attendee_metadata: Mapped[Optional[str]] = mapped_column("metadata", Text)
 
     event: Mapped[Event] = relationship("Event", back_populates="registrations")
     attendance_record: Mapped[Optional["AttendanceRecord"]] = relationship(
@@ -376,6 +452,8 @@ class WaitlistEntry(TimestampMixin, Base):
         UniqueConstraint(
             "event_id", "attendee_email", name="uq_waitlist_event_email"
         ),
+        # Promotion takes the oldest entries of an event first.
+        Index("ix_waitlist_event_created", "event_id", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -398,7 +476,7 @@ class AttendanceRecord(TimestampMixin, Base):
     )
     check_in_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     check_in_method: Mapped[Optional[str]] = mapped_column(String(50))
-    scan_payload: Mapped[Optional[str]] = mapped_column(Text)
+    scan_payload: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
 
     registration: Mapped[Registration] = relationship(
         "Registration", back_populates="attendance_record"
@@ -407,6 +485,10 @@ class AttendanceRecord(TimestampMixin, Base):
 
 class NoShowPenalty(TimestampMixin, Base):
     __tablename__ = "no_show_penalties"
+    __table_args__ = (
+        # Every registration looks up unexpired penalties by email.
+        Index("ix_penalties_email_expires", "attendee_email", "expires_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     attendee_email: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -441,7 +523,7 @@ class ParticipantProfile(TimestampMixin, Base):
     interests: Mapped[Optional[dict]] = mapped_column(JSON)
     goals: Mapped[Optional[dict]] = mapped_column(JSON)
     availability: Mapped[Optional[dict]] = mapped_column(JSON)
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
 
     event: Mapped[Event] = relationship("Event", back_populates="participant_profiles")
     sent_suggestions: Mapped[List["NetworkingSuggestion"]] = relationship(
@@ -484,7 +566,7 @@ class NetworkingSuggestion(TimestampMixin, Base):
         nullable=False,
         default="pending",
     )
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
 
     event: Mapped[Event] = relationship("Event", back_populates="networking_suggestions")
     participant: Mapped[ParticipantProfile] = relationship(
@@ -516,7 +598,7 @@ class EventFeedback(TimestampMixin, Base):
         nullable=False,
         default="pending",
     )
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
     moderated_by: Mapped[Optional[str]] = mapped_column(String(120))
     moderated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
@@ -542,7 +624,7 @@ class EventSpeaker(TimestampMixin, Base):
     topics: Mapped[Optional[dict]] = mapped_column(JSON)
     contact_email: Mapped[Optional[str]] = mapped_column(String(255))
     photo_url: Mapped[Optional[str]] = mapped_column(String(500))
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
     display_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     event: Mapped[Event] = relationship("Event", back_populates="speaker_profiles")
@@ -561,12 +643,17 @@ class EventSponsor(TimestampMixin, Base):
     website: Mapped[Optional[str]] = mapped_column(String(500))
     logo_url: Mapped[Optional[str]] = mapped_column(String(500))
     contact_email: Mapped[Optional[str]] = mapped_column(String(255))
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    extra_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
     display_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     event: Mapped[Event] = relationship("Event", back_populates="sponsors")
 
 
+# Resolve relationships and compile mappers at import time so the first
+# request does not pay for it (and mapping errors surface on startup).
+configure_mappers()
+
+
 __all__ = [
     "Event",
     "EventApproval",
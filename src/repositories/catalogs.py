@@ -1,11 +1,11 @@
 """Repository helpers for taxonomies and templates."""
 from __future__ import annotations
 
-from typing import Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, insert, inspect, select
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from src.models import (
     EventCategory,
@@ -22,6 +22,20 @@ __all__ = [
     "TemplateRepository",
 ]
 
+# Statements for the hot read paths are built once; executing the same
+# construct skips rebuilding it and hits the engine's compiled cache.
+_LIST_CATEGORIES = select(EventCategory).order_by(EventCategory.name.asc())
+_LIST_TAGS = select(EventTag).order_by(EventTag.name.asc())
+_LIST_SERIES = select(EventSeries).order_by(EventSeries.name.asc())
+_SERIES_BY_NAME = select(EventSeries).where(func.lower(EventSeries.name) == bindparam("name"))
+# Translations come in one IN query rather than a join repeating each
+# template row per locale; anything else touched while rendering raises.
+_LIST_TEMPLATES = (
+    select(EventTemplate)
+    .options(selectinload(EventTemplate.translations), raiseload("*"))
+    .order_by(EventTemplate.name.asc())
+)
+
 
 class BaseRepository:
     """Base repository storing the SQLAlchemy session."""
@@ -29,13 +43,25 @@ class BaseRepository:
     def __init__(self, session: Session) -> None:
         self.session = session
 
+    def _insert_returning(self, model, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Insert ``rows`` in batched INSERT .. RETURNING statements.
+
+        The returned instances are persistent and carry their primary keys and
+        server defaults, so no refresh round-trip is needed afterwards.
+        """
+        stmt = insert(model).returning(model, sort_by_parameter_order=True)
+        return list(self.session.scalars(stmt, rows))
+
 
 class CategoryRepository(BaseRepository):
     """Repository for :class:`EventCategory`."""
 
     def list(self) -> Sequence[EventCategory]:
-        query = select(EventCategory).order_by(EventCategory.name.asc())
-        return self.session.scalars(query).all()
+        return self.session.scalars(_LIST_CATEGORIES).all()
+
+    def iter_all(self, chunk: int = 1000) -> Iterator[EventCategory]:
+        """Yield categories by name, fetching ``chunk`` rows at a time."""
+        return self.session.scalars(_LIST_CATEGORIES, execution_options={"yield_per": chunk})
 
     def get(self, category_id: int) -> EventCategory:
         category = self.session.get(EventCategory, category_id)
@@ -44,11 +70,10 @@ class CategoryRepository(BaseRepository):
         return category
 
     def create(self, *, name: str, description: Optional[str]) -> EventCategory:
-        category = EventCategory(name=name, description=description)
-        self.session.add(category)
-        self.session.flush()
-        self.session.refresh(category)
-        return category
+        return self.bulk_create([{"name": name, "description": description}])[0]
+
+    def bulk_create(self, items: List[Dict[str, Any]]) -> List[EventCategory]:
+        return self._insert_returning(EventCategory, items)
 
     def delete(self, category: EventCategory) -> None:
         self.session.delete(category)
@@ -59,7 +84,6 @@ class CategoryRepository(BaseRepository):
         if description is not None:
             category.description = description
         self.session.flush()
-        self.session.refresh(category)
         return category
 
 
@@ -67,8 +91,11 @@ class TagRepository(BaseRepository):
     """Repository for :class:`EventTag`."""
 
     def list(self) -> Sequence[EventTag]:
-        query = select(EventTag).order_by(EventTag.name.asc())
-        return self.session.scalars(query).all()
+        return self.session.scalars(_LIST_TAGS).all()
+
+    def iter_all(self, chunk: int = 1000) -> Iterator[EventTag]:
+        """Yield tags by name, fetching ``chunk`` rows at a time."""
+        return self.session.scalars(_LIST_TAGS, execution_options={"yield_per": chunk})
 
     def get(self, tag_id: int) -> EventTag:
         tag = self.session.get(EventTag, tag_id)
@@ -77,11 +104,10 @@ class TagRepository(BaseRepository):
         return tag
 
     def create(self, *, name: str) -> EventTag:
-        tag = EventTag(name=name)
-        self.session.add(tag)
-        self.session.flush()
-        self.session.refresh(tag)
-        return tag
+        return self.bulk_create([{"name": name}])[0]
+
+    def bulk_create(self, items: List[Dict[str, Any]]) -> List[EventTag]:
+        return self._insert_returning(EventTag, items)
 
     def delete(self, tag: EventTag) -> None:
         self.session.delete(tag)
@@ -90,7 +116,6 @@ class TagRepository(BaseRepository):
         if name is not None:
             tag.name = name
         self.session.flush()
-        self.session.refresh(tag)
         return tag
 
 
@@ -98,8 +123,7 @@ class SeriesRepository(BaseRepository):
     """Repository for :class:`EventSeries`."""
 
     def list(self) -> Sequence[EventSeries]:
-        query = select(EventSeries).order_by(EventSeries.name.asc())
-        return self.session.scalars(query).all()
+        return self.session.scalars(_LIST_SERIES).all()
 
     def get(self, series_id: int) -> EventSeries:
         series = self.session.get(EventSeries, series_id)
@@ -108,15 +132,13 @@ class SeriesRepository(BaseRepository):
         return series
 
     def get_by_name(self, name: str) -> Optional[EventSeries]:
-        query = select(EventSeries).where(func.lower(EventSeries.name) == name.casefold())
-        return self.session.scalars(query).first()
+        return self.session.scalars(_SERIES_BY_NAME, {"name": name.casefold()}).first()
 
     def create(self, *, name: str, description: Optional[str]) -> EventSeries:
-        series = EventSeries(name=name, description=description)
-        self.session.add(series)
-        self.session.flush()
-        self.session.refresh(series)
-        return series
+        return self.bulk_create([{"name": name, "description": description}])[0]
+
+    def bulk_create(self, items: List[Dict[str, Any]]) -> List[EventSeries]:
+        return self._insert_returning(EventSeries, items)
 
     def update(self, series: EventSeries, *, name: Optional[str], description: Optional[str]) -> EventSeries:
         if name is not None:
@@ -124,7 +146,6 @@ class SeriesRepository(BaseRepository):
         if description is not None:
             series.description = description
         self.session.flush()
-        self.session.refresh(series)
         return series
 
     def delete(self, series: EventSeries) -> None:
@@ -135,25 +156,24 @@ class TemplateRepository(BaseRepository):
     """Repository for :class:`EventTemplate`."""
 
     def list(self) -> Sequence[EventTemplate]:
-        query = (
-            select(EventTemplate)
-            .options(joinedload(EventTemplate.translations))
-            .order_by(EventTemplate.name.asc())
-        )
-        return self.session.scalars(query).all()
-
-    def get(self, template_id: int) -> EventTemplate:
-        query = (
-            select(EventTemplate)
-            .options(joinedload(EventTemplate.translations))
-            .where(EventTemplate.id == template_id)
-        )
+        return self.session.scalars(_LIST_TEMPLATES).all()
+
+    def get(self, template_id: int, *, with_translations: bool = True) -> EventTemplate:
+        """Load a template, by default with every translation joined in.
+
+        Single-locale writes pass ``with_translations=False`` and let
+        :meth:`_find_translation` probe the locale index instead.
+        """
+
+        query = select(EventTemplate).where(EventTemplate.id == template_id)
+        if with_translations:
+            query = query.options(joinedload(EventTemplate.translations))
         try:
-            return self.session.execute(query).scalar_one()
+            return self.session.execute(query).unique().scalar_one()
         except NoResultFound as exc:
             raise LookupError(f"Template {template_id} not found") from exc
 
-    def get_by_name(self, name: str) -> Optional<EventTemplate]:
+    def get_by_name(self, name: str) -> Optional[EventTemplate]:
         query = select(EventTemplate).where(EventTemplate.name == name)
         return self.session.scalars(query).first()
 
@@ -169,20 +189,17 @@ class TemplateRepository(BaseRepository):
         default_capacity_limit: Optional[int],
         default_metadata: Optional[dict],
     ) -> EventTemplate:
-        template = EventTemplate(
-            name=name,
-            description=description,
-            default_duration_minutes=default_duration_minutes,
-            default_timezone=default_timezone,
-            default_locale=default_locale,
-            fallback_locale=fallback_locale,
-            default_capacity_limit=default_capacity_limit,
-            default_metadata=default_metadata,
-        )
-        self.session.add(template)
-        self.session.flush()
-        self.session.refresh(template)
-        return template
+        row = {
+            "name": name,
+            "description": description,
+            "default_duration_minutes": default_duration_minutes,
+            "default_timezone": default_timezone,
+            "default_locale": default_locale,
+            "fallback_locale": fallback_locale,
+            "default_capacity_limit": default_capacity_limit,
+            "default_metadata": default_metadata,
+        }
+        return self._insert_returning(EventTemplate, [row])[0]
 
     def update(
         self,
@@ -211,7 +228,6 @@ class TemplateRepository(BaseRepository):
         if default_metadata is not None:
             template.default_metadata = default_metadata
         self.session.flush()
-        self.session.refresh(template)
         return template
 
     def delete(self, template: EventTemplate) -> None:
@@ -225,10 +241,7 @@ class TemplateRepository(BaseRepository):
         title: str,
         description: Optional[str],
     ) -> EventTemplateTranslation:
-        translation = next(
-            (t for t in template.translations if t.locale == locale),
-            None,
-        )
+        translation = self._find_translation(template, locale)
         if translation is None:
             translation = EventTemplateTranslation(
                 template=template,
@@ -240,13 +253,25 @@ class TemplateRepository(BaseRepository):
         else:
             translation.title = title
             translation.description = description
-        self.session.flush()
-        self.session.refresh(translation)
+        # The callers commit right after, which flushes the row; the
+        # serialised translation only reads attributes set here.
         return translation
 
     def remove_translation(self, template: EventTemplate, locale: str) -> None:
-        translation = next((t for t in template.translations if t.locale == locale), None)
+        translation = self._find_translation(template, locale)
         if translation is None:
             raise LookupError(f"Translation {locale} not found for template {template.id}")
         self.session.delete(translation)
 
+    def _find_translation(
+        self, template: EventTemplate, locale: str
+    ) -> Optional[EventTemplateTranslation]:
+        # Reuse the collection when it is already loaded; otherwise probe the
+        # (template_id, locale) unique index instead of materialising it.
+        if "translations" in inspect(template).unloaded:
+            query = select(EventTemplateTranslation).where(
+                EventTemplateTranslation.template_id == template.id,
+                EventTemplateTranslation.locale == locale,
+            )
+            return self.session.scalars(query).first()
+        return next((t for t in template.translations if t.locale == locale), None)
@@ -39,6 +39,9 @@ class EventRepository:
         after: Optional[date] = None,
         status: Optional[str] = None,
     ) -> Sequence[Event]:
+        # Listings are only serialised, which reads the series, taxonomies
+        # and translations; loading the networking, feedback and partner
+        # collections here would build objects that are thrown away.
         query = (
             select(Event)
             .options(
@@ -46,12 +49,6 @@ class EventRepository:
                 selectinload(Event.categories),
                 selectinload(Event.tags),
                 selectinload(Event.translations),
-                selectinload(Event.participant_profiles),
-                selectinload(Event.networking_suggestions)
-                .joinedload(NetworkingSuggestion.suggested_participant),
-                selectinload(Event.feedback_entries),
-                selectinload(Event.speaker_profiles),
-                selectinload(Event.sponsors),
             )
             .order_by(Event.event_date.asc(), Event.id.asc())
         )
@@ -152,14 +149,12 @@ class EventRepository:
 
         self.session.add(event)
         self.session.flush()
-        self.session.refresh(event)
         return event
 
     def update_event(self, event: Event, updates: dict) -> Event:
         for key, value in updates.items():
             setattr(event, key, value)
         self.session.flush()
-        self.session.refresh(event)
         return event
 
     def assign_series(self, event: Event, series: Optional[EventSeries]) -> None:
@@ -171,13 +166,11 @@ class EventRepository:
     ) -> Event:
         event.categories = list(categories)
         self.session.flush()
-        self.session.refresh(event)
         return event
 
     def assign_tags(self, event: Event, tags: Iterable[EventTag]) -> Event:
         event.tags = list(tags)
         self.session.flush()
-        self.session.refresh(event)
         return event
 
     def upsert_translation(
@@ -208,8 +201,8 @@ class EventRepository:
             event.fallback_locale = locale
         elif fallback is False and event.fallback_locale == locale:
             event.fallback_locale = None
-        self.session.flush()
-        self.session.refresh(translation)
+        # Creation paths upsert several locales in a row; the caller's commit
+        # flushes them together instead of one INSERT + SELECT per locale.
         return translation
 
     def remove_translation(self, event: Event, locale: str) -> None:
@@ -239,7 +232,6 @@ class EventRepository:
         self.session.add(log)
         event.status = new_status
         self.session.flush()
-        self.session.refresh(log)
         return log
 
     def create_notification(
@@ -258,7 +250,6 @@ class EventRepository:
         )
         self.session.add(notification)
         self.session.flush()
-        self.session.refresh(notification)
         return notification
 
     def remove_event(self, event: Event) -> None:
@@ -34,11 +34,10 @@ class FeedbackRepository:
             rating=rating,
             comment=comment,
             sentiment=sentiment,
-            metadata=metadata,
+            extra_metadata=metadata,
         )
         self.session.add(feedback)
         self.session.flush()
-        self.session.refresh(feedback)
         return feedback
 
     def list_for_event(self, event_id: int) -> Sequence[EventFeedback]:
@@ -69,7 +68,6 @@ class FeedbackRepository:
         else:
             feedback.moderated_at = None
         self.session.flush()
-        self.session.refresh(feedback)
         return feedback
 
     def aggregates(self, event_id: int) -> Dict[str, float]:
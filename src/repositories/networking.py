@@ -44,9 +44,8 @@ class ParticipantProfileRepository:
         profile.interests = interests
         profile.goals = goals
         profile.availability = availability
-        profile.metadata = metadata
+        profile.extra_metadata = metadata
         self.session.flush()
-        self.session.refresh(profile)
         return profile
 
     def list_for_event(self, event_id: int) -> Sequence[ParticipantProfile]:
@@ -110,11 +109,10 @@ class NetworkingSuggestionRepository:
 
         suggestion.score = score
         suggestion.rationale = rationale
-        suggestion.metadata = metadata
+        suggestion.extra_metadata = metadata
         if status is not None:
             suggestion.status = status
         self.session.flush()
-        self.session.refresh(suggestion)
         return suggestion
 
     def list_for_participant(
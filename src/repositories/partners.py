@@ -8,6 +8,9 @@ from sqlalchemy.orm import Session
 
 from src.models import EventSpeaker, EventSponsor
 
+# Payload keys whose ORM attribute is named differently.
+_ATTRIBUTE_NAMES = {"metadata": "extra_metadata"}
+
 
 class EventSpeakerRepository:
     """Manage event speakers and organisers."""
@@ -40,12 +43,11 @@ class EventSpeakerRepository:
             topics=topics,
             contact_email=contact_email,
             photo_url=photo_url,
-            metadata=metadata,
+            extra_metadata=metadata,
             display_order=display_order,
         )
         self.session.add(speaker)
         self.session.flush()
-        self.session.refresh(speaker)
         return speaker
 
     def list_for_event(self, event_id: int, *, role: Optional[str] = None) -> Sequence[EventSpeaker]:
@@ -63,9 +65,8 @@ class EventSpeakerRepository:
 
     def update(self, speaker: EventSpeaker, updates: dict) -> EventSpeaker:
         for key, value in updates.items():
-            setattr(speaker, key, value)
+            setattr(speaker, _ATTRIBUTE_NAMES.get(key, key), value)
         self.session.flush()
-        self.session.refresh(speaker)
         return speaker
 
     def delete(self, speaker: EventSpeaker) -> None:
@@ -99,12 +100,11 @@ class EventSponsorRepository:
             website=website,
             logo_url=logo_url,
             contact_email=contact_email,
-            metadata=metadata,
+            extra_metadata=metadata,
             display_order=display_order,
         )
         self.session.add(sponsor)
         self.session.flush()
-        self.session.refresh(sponsor)
         return sponsor
 
     def list_for_event(self, event_id: int) -> Sequence[EventSponsor]:
@@ -123,9 +123,8 @@ class EventSponsorRepository:
 
     def update(self, sponsor: EventSponsor, updates: dict) -> EventSponsor:
         for key, value in updates.items():
-            setattr(sponsor, key, value)
+            setattr(sponsor, _ATTRIBUTE_NAMES.get(key, key), value)
         self.session.flush()
-        self.session.refresh(sponsor)
         return sponsor
 
     def delete(self, sponsor: EventSponsor) -> None:
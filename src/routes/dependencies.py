@@ -1,11 +1,11 @@
 """Utilities for accessing services within Flask request context."""
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar
 
 from flask import current_app, g
 
-from src.database import get_session
+from src.database import scoped_db_session
 from src.services.events import (
     CategoryService,
     EventService,
@@ -21,29 +21,17 @@ from src.services.search import EventSearchService
 
 T = TypeVar("T")
 
-SERVICE_FACTORIES: Dict[str, Callable[[Any], Any]] = {
-    "event_service": EventService,
-    "category_service": CategoryService,
-    "tag_service": TagService,
-    "series_service": SeriesService,
-    "template_service": TemplateService,
-    "networking_service": NetworkingService,
-    "feedback_service": FeedbackService,
-    "speaker_service": SpeakerService,
-    "sponsor_service": SponsorService,
-}
-
-EXTRA_SERVICE_KEYS = {"search_service", "recommendation_service"}
+# Shared by every request so the integration clients keep their circuit
+# breaker state; the session is the scoped registry.
+EVENT_SERVICE = EventService(scoped_db_session)
 
 
 def get_db_session():
-    if "db_session" not in g:
-        g.db_session = get_session()
-    return g.db_session
+    return scoped_db_session
 
 
 def get_event_service() -> EventService:
-    return _get_service("event_service", EventService)
+    return EVENT_SERVICE
 
 
 def get_category_service() -> CategoryService:
@@ -84,12 +72,12 @@ def get_search_service() -> EventSearchService:
         index_name = current_app.config.get("EVENTS_INDEX", "events")
         event_service = get_event_service()
         event_provider = lambda: event_service.list_events()
-        g["search_service"] = EventSearchService(
+        g.search_service = EventSearchService(
             client,
             index_name=index_name,
             event_provider=event_provider,
         )
-    return g["search_service"]
+    return g.search_service
 
 
 def get_recommendation_service() -> RecommendationService:
@@ -97,33 +85,25 @@ def get_recommendation_service() -> RecommendationService:
         event_service = get_event_service()
         search_service = get_search_service()
         user_client = _get_user_profile_client()
-        g["recommendation_service"] = RecommendationService(
+        g.recommendation_service = RecommendationService(
             event_service,
             user_client,
             search_service=search_service,
         )
-    return g["recommendation_service"]
+    return g.recommendation_service
 
 
 def _get_service(key: str, factory: Type[T]) -> T:
     if key not in g:
         session = get_db_session()
-        g[key] = factory(session)
-    return g[key]
+        setattr(g, key, factory(session))
+    return getattr(g, key)
 
 
 def cleanup_services(exception):
-    session = g.pop("db_session", None)
-    for key in list(SERVICE_FACTORIES.keys()):
-        g.pop(key, None)
-    for key in EXTRA_SERVICE_KEYS:
-        g.pop(key, None)
-    if session is not None:
-        try:
-            if exception is not None:
-                session.rollback()
-        finally:
-            session.close()
+    # ``g`` is discarded with the app context, so only the scoped session
+    # needs releasing; closing it also rolls back an unfinished transaction.
+    scoped_db_session.remove()
 
 
 def _get_search_client():
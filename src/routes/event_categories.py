@@ -4,7 +4,7 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 
 from src.routes.dependencies import get_category_service
-from src.routes.utils import error_response
+from src.routes.utils import error_response, json_body_error, stream_json_list
 from src.services.events import ValidationError
 
 categories_bp = Blueprint("event_categories", __name__)
@@ -13,17 +13,14 @@ categories_bp = Blueprint("event_categories", __name__)
 @categories_bp.get("/event-categories")
 def list_categories():
     service = get_category_service()
-    categories = service.list_categories()
-    return jsonify({"categories": categories})
+    return stream_json_list("categories", service.iter_categories())
 
 
 @categories_bp.post("/event-categories")
 def create_category():
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -49,11 +46,9 @@ def get_category(category_id: int):
 
 @categories_bp.route("/event-categories/<int:category_id>", methods=["PUT", "PATCH"])
 def update_category(category_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
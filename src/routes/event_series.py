@@ -4,7 +4,7 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 
 from src.routes.dependencies import get_series_service
-from src.routes.utils import error_response
+from src.routes.utils import error_response, json_body_error
 from src.services.events import ValidationError
 
 series_bp = Blueprint("event_series", __name__)
@@ -19,11 +19,9 @@ def list_series():
 
 @series_bp.post("/event-series")
 def create_series():
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -49,11 +47,9 @@ def get_series(series_id: int):
 
 @series_bp.route("/event-series/<int:series_id>", methods=["PUT", "PATCH"])
 def update_series(series_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
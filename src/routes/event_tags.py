@@ -4,7 +4,7 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 
 from src.routes.dependencies import get_tag_service
-from src.routes.utils import error_response
+from src.routes.utils import error_response, json_body_error, stream_json_list
 from src.services.events import ValidationError
 
 tags_bp = Blueprint("event_tags", __name__)
@@ -13,17 +13,14 @@ tags_bp = Blueprint("event_tags", __name__)
 @tags_bp.get("/event-tags")
 def list_tags():
     service = get_tag_service()
-    tags = service.list_tags()
-    return jsonify({"tags": tags})
+    return stream_json_list("tags", service.iter_tags())
 
 
 @tags_bp.post("/event-tags")
 def create_tag():
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -49,11 +46,9 @@ def get_tag(tag_id: int):
 
 @tags_bp.route("/event-tags/<int:tag_id>", methods=["PUT", "PATCH"])
 def update_tag(tag_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -4,7 +4,7 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 
 from src.routes.dependencies import get_template_service
-from src.routes.utils import error_response
+from src.routes.utils import error_response, json_body_error
 from src.services.events import ValidationError
 
 templates_bp = Blueprint("event_templates", __name__)
@@ -19,11 +19,9 @@ def list_templates():
 
 @templates_bp.post("/event-templates")
 def create_template():
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -49,11 +47,9 @@ def get_template(template_id: int):
 
 @templates_bp.route("/event-templates/<int:template_id>", methods=["PUT", "PATCH"])
 def update_template(template_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -80,11 +76,9 @@ def delete_template(template_id: int):
 
 @templates_bp.post("/event-templates/<int:template_id>/translations")
 def add_template_translation(template_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -101,11 +95,9 @@ def add_template_translation(template_id: int):
 
 @templates_bp.put("/event-templates/<int:template_id>/translations/<locale>")
 def update_template_translation(template_id: int, locale: str):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
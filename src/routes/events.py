@@ -10,7 +10,7 @@ from src.routes.dependencies import (
     get_speaker_service,
     get_sponsor_service,
 )
-from src.routes.utils import error_response
+from src.routes.utils import error_response, json_body_error
 from src.services.events import (
     ApprovalWorkflowError,
     EventNotFoundError,
@@ -104,69 +104,6 @@ def events_map():
     return jsonify({"type": "FeatureCollection", "features": features})
 
 
-@events_bp.post("/events")
-def create_event():
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
-
-    data = request.get_json(silent=True)
-    if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
-    if not isinstance(data, dict):
-        return error_response(
-            400,
-            "Payload JSON invalide: un objet JSON (type dict) est requis.",
-        )
-
-    service = get_event_service()
-    try:
-        created_event = service.create_event(data)
-    except ValidationError as exc:
-        return error_response(422, exc.message, exc.errors)
-
-    payload = {
-        "message": "Event created",
-        "event_id": created_event["id"],
-        "event": created_event,
-    }
-    return jsonify(payload), 201
-
-
-@events_bp.get("/events/<int:event_id>")
-def get_event(event_id: int):
-    service = get_event_service()
-    try:
-        event = service.get_event(event_id)
-    except EventNotFoundError:
-        return error_response(404, "Événement introuvable.")
-    return jsonify({"event": event})
-
-
-@events_bp.patch("/events/<int:event_id>")
-def update_event(event_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
-
-    data = request.get_json(silent=True)
-    if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
-    if not isinstance(data, dict):
-        return error_response(
-            400,
-            "Payload JSON invalide: un objet JSON (type dict) est requis.",
-        )
-
-    service = get_event_service()
-    try:
-        updated_event = service.update_event(event_id, data)
-    except EventNotFoundError:
-        return error_response(404, "Événement introuvable.")
-    except ValidationError as exc:
-        return error_response(422, exc.message, exc.errors)
-
-    return jsonify({"message": "Event updated", "event": updated_event})
-
-
 @events_bp.post("/events/<int:event_id>/bookmark")
 def bookmark_event(event_id: int):
     user_id = _resolve_user_identifier()
@@ -209,11 +146,9 @@ def list_bookmarks(event_id: int):
 
 @events_bp.post("/events/from-template")
 def create_event_from_template():
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -242,11 +177,9 @@ def create_event_from_template():
 
 @events_bp.post("/events/<int:event_id>/translations")
 def add_translation(event_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -264,11 +197,9 @@ def add_translation(event_id: int):
 
 @events_bp.put("/events/<int:event_id>/translations/<locale>")
 def update_translation(event_id: int, locale: str):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     data = request.get_json(silent=True)
     if data is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -319,10 +250,9 @@ def _extract_geo_coordinates(event):
 
 def _resolve_user_identifier():
     user_id = None
-    if request.is_json:
-        payload = request.get_json(silent=True) or {}
-        if isinstance(payload, dict):
-            user_id = payload.get("user_id")
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict):
+        user_id = payload.get("user_id")
     if not user_id:
         user_id = request.args.get("user_id")
     if isinstance(user_id, str):
@@ -331,10 +261,7 @@ def _resolve_user_identifier():
 
 
 def _handle_workflow(event_id: int, action: str):
-    if request.is_json:
-        data = request.get_json(silent=True) or {}
-    else:
-        data = {}
+    data = request.get_json(silent=True) or {}
     if not isinstance(data, dict):
         return error_response(
             400,
@@ -376,11 +303,9 @@ def reject_event(event_id: int):
 
 @events_bp.post("/events/<int:event_id>/networking/profiles")
 def register_networking_profile(event_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_networking_service()
     try:
@@ -439,11 +364,9 @@ def list_networking_suggestions(event_id: int):
 
 @events_bp.post("/events/<int:event_id>/feedback")
 def submit_feedback(event_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_feedback_service()
     try:
@@ -467,11 +390,9 @@ def list_feedback(event_id: int):
 
 @events_bp.patch("/events/<int:event_id>/feedback/<int:feedback_id>")
 def moderate_feedback(event_id: int, feedback_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_feedback_service()
     try:
@@ -496,11 +417,9 @@ def list_speakers(event_id: int):
 
 @events_bp.post("/events/<int:event_id>/speakers")
 def add_speaker(event_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_speaker_service()
     try:
@@ -514,11 +433,9 @@ def add_speaker(event_id: int):
 
 @events_bp.patch("/events/<int:event_id>/speakers/<int:speaker_id>")
 def update_speaker(event_id: int, speaker_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_speaker_service()
     try:
@@ -552,11 +469,9 @@ def list_sponsors(event_id: int):
 
 @events_bp.post("/events/<int:event_id>/sponsors")
 def add_sponsor(event_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_sponsor_service()
     try:
@@ -570,11 +485,9 @@ def add_sponsor(event_id: int):
 
 @events_bp.patch("/events/<int:event_id>/sponsors/<int:sponsor_id>")
 def update_sponsor(event_id: int, sponsor_id: int):
-    if not request.is_json:
-        return error_response(415, "Content-Type 'application/json' requis.")
     payload = request.get_json(silent=True)
     if payload is None:
-        return error_response(400, "JSON invalide ou non parsable.")
+        return json_body_error()
 
     service = get_sponsor_service()
     try:
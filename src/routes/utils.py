@@ -1,9 +1,16 @@
 """Shared route utilities."""
 from __future__ import annotations
 
-from typing import Any, Optional
+import json
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-from flask import jsonify
+from flask import Response, current_app, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 
 def error_response(status: int, message: str, details: Optional[Any] = None):
@@ -11,3 +18,93 @@ def error_response(status: int, message: str, details: Optional[Any] = None):
     if details is not None:
         payload["error"]["details"] = details
     return jsonify(payload), status
+
+
+def json_body_error():
+    """Explain why ``request.get_json(silent=True)`` returned ``None``.
+
+    Handlers parse first and only inspect the content type on failure, so
+    the happy path never evaluates ``request.is_json`` separately.
+    """
+
+    if not request.is_json:
+        return error_response(415, "Content-Type 'application/json' requis.")
+    return error_response(400, "JSON invalide ou non parsable.")
+
+
+def static_error_response(status: int, message: str) -> Callable[[], Response]:
+    """Serialise a fixed :func:`error_response` body once.
+
+    The returned factory builds a fresh :class:`Response` around the
+    pre-encoded bytes, so frequent errors skip JSON encoding entirely.
+    """
+
+    body = json.dumps(
+        {"error": {"code": status, "message": message}},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    def factory() -> Response:
+        return Response(body, status, mimetype="application/json")
+
+    return factory
+
+
+def stream_json_list(key: str, items: Iterable[Any], *, chunk_size: int = 100) -> Response:
+    """Stream ``{"<key>": [...]}`` without materialising the whole list.
+
+    Items are encoded with the application's JSON provider and written in
+    chunks of ``chunk_size`` so large listings keep a flat memory profile.
+    """
+
+    def generate() -> Iterator[bytes]:
+        dumps = current_app.json.dumps
+        yield f'{{"{key}":['.encode("utf-8")
+        separator = b""
+        buffer = []
+        for item in items:
+            buffer.append(dumps(item))
+            if len(buffer) >= chunk_size:
+                yield separator + ",".join(buffer).encode("utf-8")
+                separator = b","
+                buffer = []
+        if buffer:
+            yield separator + ",".join(buffer).encode("utf-8")
+        yield b"]}"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by ``orjson``.
+
+    Dates are passed through to Flask's ``default`` so responses keep the
+    same HTTP-date format as the stdlib provider.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        default = kwargs.get("default", self.default)
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class OrjsonCodec:
+    """``json`` module stand-in used by Socket.IO to encode packets."""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
@@ -14,7 +14,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional
 __all__ = ["EventIndexer", "EventDocument"]
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDocument:
     """Representation of an event ready for Elasticsearch indexing."""
 
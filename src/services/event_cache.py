@@ -0,0 +1,77 @@
+"""Short-lived per-process cache of serialised events for ``GET /events/<id>``.
+
+Entries are invalidated when a session commits a write touching the event, so
+every service write path is covered whatever URL triggered it. Other workers
+may still serve a stale copy for at most the TTL.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models import Event
+
+__all__ = [
+    "cache_event",
+    "clear_event_cache",
+    "get_cached_event",
+    "invalidate_event",
+]
+
+_CACHE: TTLCache[int, Dict[str, Any]] = TTLCache(maxsize=1024, ttl=5.0)
+_LOCK = threading.Lock()
+# ``session.info`` key holding the ids flushed since the last commit; ``None``
+# in the set means a row not tied to one event changed (category, tag...).
+_PENDING_KEY = "event_cache_pending"
+
+
+def get_cached_event(event_id: int) -> Optional[Dict[str, Any]]:
+    with _LOCK:
+        return _CACHE.get(event_id)
+
+
+def cache_event(event_id: int, payload: Dict[str, Any]) -> None:
+    with _LOCK:
+        _CACHE[event_id] = payload
+
+
+def invalidate_event(event_id: int) -> None:
+    with _LOCK:
+        _CACHE.pop(event_id, None)
+
+
+def clear_event_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_events(session: Session, flush_context) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Event):
+            pending.add(instance.id)
+        else:
+            pending.add(getattr(instance, "event_id", None))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_events(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if None in pending:
+        clear_event_cache()
+        return
+    with _LOCK:
+        for event_id in pending:
+            _CACHE.pop(event_id, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -4,10 +4,11 @@ from __future__ import annotations
 import copy
 import re
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -40,12 +41,37 @@ LOCALE_PATTERN = re.compile(r"^[a-z]{2}(?:[-_][A-Z]{2})?$")
 EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 ALLOWED_STATUSES = {"draft", "pending", "approved", "rejected"}
 DEFAULT_SHARE_BASE_URL = "https://meetinity.events"
+DEFAULT_LOCATION = "TBD"
+DEFAULT_EVENT_TYPE = "general"
+# Nullable free-text event fields: stripped once, rejected when blank.
+_OPTIONAL_TEXT_FIELDS = (
+    ("streaming_url", "URL de streaming invalide."),
+    ("virtual_platform", "Plateforme virtuelle invalide."),
+    ("virtual_access_instructions", "Instructions d'accès invalides."),
+    ("secure_access_token", "Jeton d'accès sécurisé invalide."),
+    ("rtmp_ingest_url", "URL RTMP invalide."),
+    ("rtmp_stream_key", "Clé RTMP invalide."),
+)
 
 
 def is_valid_locale(value: str) -> bool:
     return bool(isinstance(value, str) and LOCALE_PATTERN.match(value))
 
 
+def parse_iso_date(value: str) -> date:
+    """Parse a ``YYYY-MM-DD`` string.
+
+    Canonical dates take the C-level ``date.fromisoformat`` path; anything
+    else falls back to ``strptime`` so unpadded inputs stay accepted.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 def validate_translation_payload(
     payload: Dict[str, Any], *, require_locale: bool
 ) -> Dict[str, Any]:
@@ -64,10 +90,11 @@ def validate_translation_payload(
 
     if "title" in payload or require_locale:
         title = payload.get("title")
-        if not isinstance(title, str) or not title.strip():
+        title = title.strip() if isinstance(title, str) else ""
+        if not title:
             errors.setdefault("title", []).append("Titre requis pour la traduction.")
         else:
-            clean["title"] = title.strip()
+            clean["title"] = title
 
     if "description" in payload:
         description = payload.get("description")
@@ -179,7 +206,7 @@ class EventService:
     def create_event(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         clean_payload = self._validate_event_payload(payload, require_title=True)
 
-        event_date = clean_payload.pop("event_date", date.today())
+        event_date = clean_payload.pop("event_date", None) or date.today()
         series = self._resolve_series(clean_payload)
         categories = self._resolve_categories(clean_payload)
         tags = self._resolve_tags(clean_payload)
@@ -319,7 +346,7 @@ class EventService:
         merged_payload = self._build_payload_from_template(template, payload)
         clean_payload = self._validate_event_payload(merged_payload, require_title=True)
 
-        event_date = clean_payload.pop("event_date", date.today())
+        event_date = clean_payload.pop("event_date", None) or date.today()
         series = self._resolve_series(clean_payload)
         categories = self._resolve_categories(clean_payload)
         tags = self._resolve_tags(clean_payload)
@@ -471,7 +498,8 @@ class EventService:
 
         if "title" in data or require_title:
             title = data.get("title")
-            if not isinstance(title, str) or not title.strip():
+            # ``isspace`` answers "blank?" without allocating a stripped copy.
+            if not isinstance(title, str) or not title or title.isspace():
                 errors.setdefault("title", []).append(
                     "Champ requis (string non vide)."
                 )
@@ -480,7 +508,8 @@ class EventService:
 
         if "attendees" in data:
             attendees = data["attendees"]
-            if isinstance(attendees, bool) or not isinstance(attendees, int) or attendees < 0:
+            # An exact type check rules out ``bool`` in the same test.
+            if type(attendees) is not int or attendees < 0:
                 errors.setdefault("attendees", []).append(
                     "Doit être un entier >= 0 (valeur booléenne non autorisée)."
                 )
@@ -501,34 +530,35 @@ class EventService:
             else:
                 stripped = provided_date.strip()
                 try:
-                    clean["event_date"] = datetime.strptime(stripped, "%Y-%m-%d").date()
+                    clean["event_date"] = parse_iso_date(stripped)
                 except ValueError:
                     errors.setdefault("date", []).append(
                         "Format de date invalide, attendu YYYY-MM-DD."
                     )
 
         if "location" in data:
-            location = data.get("location")
+            location = data["location"]
             clean["location"] = location.strip() if isinstance(location, str) else location
         elif require_title:
-            clean.setdefault("location", "TBD")
+            clean["location"] = DEFAULT_LOCATION
 
         if "type" in data:
-            event_type = data.get("type")
+            event_type = data["type"]
             clean["event_type"] = event_type.strip() if isinstance(event_type, str) else event_type
         elif require_title:
-            clean.setdefault("event_type", "general")
+            clean["event_type"] = DEFAULT_EVENT_TYPE
 
         if "timezone" in data or require_title:
             timezone = data.get("timezone", "UTC")
             if timezone is None:
                 timezone = "UTC"
-            if not isinstance(timezone, str) or not timezone.strip():
+            timezone = timezone.strip() if isinstance(timezone, str) else ""
+            if not timezone:
                 errors.setdefault("timezone", []).append("Fuseau horaire invalide.")
             else:
                 try:
-                    ZoneInfo(timezone.strip())
-                    clean["timezone"] = timezone.strip()
+                    ZoneInfo(timezone)
+                    clean["timezone"] = timezone
                 except ZoneInfoNotFoundError:
                     errors.setdefault("timezone", []).append("Fuseau horaire introuvable.")
 
@@ -546,69 +576,24 @@ class EventService:
             else:
                 clean["event_format"] = event_format
 
-        if "streaming_url" in data:
-            streaming_url = data.get("streaming_url")
-            if streaming_url is None:
-                clean["streaming_url"] = None
-            elif not isinstance(streaming_url, str) or not streaming_url.strip():
-                errors.setdefault("streaming_url", []).append("URL de streaming invalide.")
-            else:
-                clean["streaming_url"] = streaming_url.strip()
-
-        if "virtual_platform" in data:
-            platform = data.get("virtual_platform")
-            if platform is None:
-                clean["virtual_platform"] = None
-            elif not isinstance(platform, str) or not platform.strip():
-                errors.setdefault("virtual_platform", []).append("Plateforme virtuelle invalide.")
-            else:
-                clean["virtual_platform"] = platform.strip()
-
-        if "virtual_access_instructions" in data:
-            instructions = data.get("virtual_access_instructions")
-            if instructions is None:
-                clean["virtual_access_instructions"] = None
-            elif not isinstance(instructions, str) or not instructions.strip():
-                errors.setdefault("virtual_access_instructions", []).append(
-                    "Instructions d'accès invalides."
-                )
-            else:
-                clean["virtual_access_instructions"] = instructions.strip()
-
-        if "secure_access_token" in data:
-            token = data.get("secure_access_token")
-            if token is None:
-                clean["secure_access_token"] = None
-            elif not isinstance(token, str) or not token.strip():
-                errors.setdefault("secure_access_token", []).append(
-                    "Jeton d'accès sécurisé invalide."
-                )
+        for field, message in _OPTIONAL_TEXT_FIELDS:
+            if field not in data:
+                continue
+            value = data[field]
+            if value is None:
+                clean[field] = None
+                continue
+            stripped = value.strip() if isinstance(value, str) else ""
+            if stripped:
+                clean[field] = stripped
             else:
-                clean["secure_access_token"] = token.strip()
-
-        if "rtmp_ingest_url" in data:
-            ingest_url = data.get("rtmp_ingest_url")
-            if ingest_url is None:
-                clean["rtmp_ingest_url"] = None
-            elif not isinstance(ingest_url, str) or not ingest_url.strip():
-                errors.setdefault("rtmp_ingest_url", []).append("URL RTMP invalide.")
-            else:
-                clean["rtmp_ingest_url"] = ingest_url.strip()
-
-        if "rtmp_stream_key" in data:
-            stream_key = data.get("rtmp_stream_key")
-            if stream_key is None:
-                clean["rtmp_stream_key"] = None
-            elif not isinstance(stream_key, str) or not stream_key.strip():
-                errors.setdefault("rtmp_stream_key", []).append("Clé RTMP invalide.")
-            else:
-                clean["rtmp_stream_key"] = stream_key.strip()
+                errors.setdefault(field, []).append(message)
 
         if "capacity_limit" in data:
             capacity = data.get("capacity_limit")
             if capacity is None:
                 clean["capacity_limit"] = None
-            elif isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 0:
+            elif type(capacity) is not int or capacity < 0:
                 errors.setdefault("capacity_limit", []).append(
                     "Doit être un entier >= 0 ou null."
                 )
@@ -670,15 +655,17 @@ class EventService:
             series = data.get("series")
             if isinstance(series, dict):
                 name = series.get("name")
-                if isinstance(name, str) and name.strip():
-                    clean["series_name"] = name.strip()
+                name = name.strip() if isinstance(name, str) else ""
+                if name:
+                    clean["series_name"] = name
                 else:
                     errors.setdefault("series", []).append(
                         "Champ 'name' requis pour la série."
                     )
             elif isinstance(series, str):
-                if series.strip():
-                    clean["series_name"] = series.strip()
+                series = series.strip()
+                if series:
+                    clean["series_name"] = series
                 else:
                     errors.setdefault("series", []).append(
                         "Nom de série invalide."
@@ -739,7 +726,7 @@ class EventService:
         if not isinstance(value, str) or not value.strip():
             raise ValidationError({field: ["Format de date invalide pour le filtre, attendu YYYY-MM-DD."]})
         try:
-            return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+            return parse_iso_date(value.strip())
         except ValueError as exc:
             raise ValidationError({field: ["Format de date invalide pour le filtre, attendu YYYY-MM-DD."]}) from exc
 
@@ -805,14 +792,7 @@ class EventService:
         payload["_categories_specified"] = True
         if not category_ids:
             return []
-        categories = []
-        missing = []
-        for category_id in category_ids:
-            category = self.session.get(EventCategory, category_id)
-            if category is None:
-                missing.append(str(category_id))
-            else:
-                categories.append(category)
+        categories, missing = self._load_by_ids(EventCategory, category_ids)
         if missing:
             raise ValidationError({"category_ids": [f"Catégories introuvables: {', '.join(missing)}"]})
         return categories
@@ -824,18 +804,24 @@ class EventService:
         payload["_tags_specified"] = True
         if not tag_ids:
             return []
-        tags = []
-        missing = []
-        for tag_id in tag_ids:
-            tag = self.session.get(EventTag, tag_id)
-            if tag is None:
-                missing.append(str(tag_id))
-            else:
-                tags.append(tag)
+        tags, missing = self._load_by_ids(EventTag, tag_ids)
         if missing:
             raise ValidationError({"tag_ids": [f"Tags introuvables: {', '.join(missing)}"]})
         return tags
 
+    def _load_by_ids(self, model, ids: List[int]) -> Tuple[List[Any], List[str]]:
+        """Fetch ``ids`` in one query and return them in request order.
+
+        Rows are indexed by id so each lookup is a dict hit rather than a
+        ``session.get`` round-trip per identifier.
+        """
+        found = {
+            item.id: item
+            for item in self.session.scalars(select(model).where(model.id.in_(set(ids))))
+        }
+        missing = [str(item_id) for item_id in ids if item_id not in found]
+        return [found[item_id] for item_id in ids if item_id in found], missing
+
     def _ensure_capacity_constraints(self, event) -> None:
         if event.capacity_limit is not None and event.capacity_limit < event.attendees:
             raise ValidationError(
@@ -1198,6 +1184,9 @@ class CategoryService(CatalogBaseService):
         categories = self.repository.list()
         return [self._serialize(category) for category in categories]
 
+    def iter_categories(self) -> Iterator[Dict[str, Any]]:
+        return (self._serialize(category) for category in self.repository.iter_all())
+
     def get_category(self, category_id: int) -> Dict[str, Any]:
         try:
             category = self.repository.get(category_id)
@@ -1259,6 +1248,9 @@ class TagService(CatalogBaseService):
         tags = self.repository.list()
         return [self._serialize(tag) for tag in tags]
 
+    def iter_tags(self) -> Iterator[Dict[str, Any]]:
+        return (self._serialize(tag) for tag in self.repository.iter_all())
+
     def get_tag(self, tag_id: int) -> Dict[str, Any]:
         try:
             tag = self.repository.get(tag_id)
@@ -1480,7 +1472,7 @@ class TemplateService(CatalogBaseService):
 
     def upsert_translation(self, template_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            template = self.repository.get(template_id)
+            template = self.repository.get(template_id, with_translations=False)
         except LookupError as exc:
             raise ValidationError({"id": [str(exc)]}) from exc
 
@@ -1503,7 +1495,7 @@ class TemplateService(CatalogBaseService):
         if not isinstance(locale, str) or not locale:
             raise ValidationError({"locale": ["Locale invalide."]})
         try:
-            template = self.repository.get(template_id)
+            template = self.repository.get(template_id, with_translations=False)
         except LookupError as exc:
             raise ValidationError({"id": [str(exc)]}) from exc
         try:
@@ -1537,7 +1529,7 @@ class TemplateService(CatalogBaseService):
     def _validate_optional_int(self, value: Any, field: str) -> Optional[int]:
         if value is None:
             return None
-        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        if type(value) is not int or value < 0:
             raise ValidationError({field: ["Doit être un entier >= 0 ou null."]})
         return value
 
@@ -170,7 +170,7 @@ class FeedbackService:
             "comment": feedback.comment,
             "sentiment": feedback.sentiment,
             "status": feedback.status,
-            "metadata": feedback.metadata or {},
+            "metadata": feedback.extra_metadata or {},
             "moderated_by": feedback.moderated_by,
             "moderated_at": feedback.moderated_at.isoformat() if feedback.moderated_at else None,
             "created_at": feedback.created_at.isoformat(),
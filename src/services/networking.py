@@ -320,7 +320,7 @@ class NetworkingService:
             "interests": self._extract_list(profile.interests, "items"),
             "goals": self._extract_list(profile.goals, "items"),
             "availability": self._extract_list(profile.availability, "slots"),
-            "metadata": profile.metadata or {},
+            "metadata": profile.extra_metadata or {},
             "created_at": profile.created_at.isoformat(),
         }
 
@@ -337,6 +337,6 @@ class NetworkingService:
             "score": suggestion.score,
             "status": suggestion.status,
             "rationale": suggestion.rationale,
-            "metadata": suggestion.metadata or {},
+            "metadata": suggestion.extra_metadata or {},
             "created_at": suggestion.created_at.isoformat(),
         }
@@ -171,7 +171,7 @@ class SpeakerService:
             "topics": speaker.topics or {},
             "contact_email": speaker.contact_email,
             "photo_url": speaker.photo_url,
-            "metadata": speaker.metadata or {},
+            "metadata": speaker.extra_metadata or {},
             "display_order": speaker.display_order,
             "created_at": speaker.created_at.isoformat(),
         }
@@ -289,7 +289,7 @@ class SponsorService:
             "website": sponsor.website,
             "logo_url": sponsor.logo_url,
             "contact_email": sponsor.contact_email,
-            "metadata": sponsor.metadata or {},
+            "metadata": sponsor.extra_metadata or {},
             "display_order": sponsor.display_order,
             "created_at": sponsor.created_at.isoformat(),
         }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import atan2, cos, radians, sin, sqrt
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol
 
 from .events import EventService
@@ -17,7 +18,7 @@ class UserProfileClient(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """Structured representation of a user profile used for recommendations."""
 
@@ -127,6 +128,11 @@ class RecommendationService:
     # Ranking helpers
     # ------------------------------------------------------------------
     def _rank_events(self, events: Iterable[Mapping[str, Any]], profile: UserProfile) -> List[Dict[str, Any]]:
+        # Preferences are constant across the loop: normalise them once
+        # rather than once per candidate event.
+        preferred_categories = self._casefold_all(profile.preferred_categories)
+        preferred_tags = self._casefold_all(profile.preferred_tags)
+        preferred_languages = self._casefold_all(profile.preferred_languages)
         scored: List[tuple[float, Dict[str, Any]]] = []
         for event in events:
             if not isinstance(event, Mapping):
@@ -135,9 +141,9 @@ class RecommendationService:
             if event_id is None:
                 continue
             score = 0.0
-            score += self._score_taxonomy(event.get("categories"), profile.preferred_categories, weight=3.0)
-            score += self._score_taxonomy(event.get("tags"), profile.preferred_tags, weight=2.0)
-            score += self._score_languages(event, profile.preferred_languages)
+            score += self._score_taxonomy(event.get("categories"), preferred_categories, weight=3.0)
+            score += self._score_taxonomy(event.get("tags"), preferred_tags, weight=2.0)
+            score += self._score_languages(event, preferred_languages)
             score += self._score_geo(event, profile)
             if event.get("status") == "approved":
                 score += 0.5
@@ -152,10 +158,15 @@ class RecommendationService:
         return [item[1] for item in scored]
 
     @staticmethod
-    def _score_taxonomy(items: Any, preferences: Iterable[str], *, weight: float) -> float:
+    def _casefold_all(values: Iterable[str]) -> List[str]:
+        return [value.casefold() for value in values if isinstance(value, str)]
+
+    @staticmethod
+    def _score_taxonomy(items: Any, preferences: List[str], *, weight: float) -> float:
+        """Score ``items`` against already casefolded ``preferences``."""
         if not items or not preferences:
             return 0.0
-        available: List[str] = []
+        available = set()
         if isinstance(items, Iterable):
             for item in items:
                 if isinstance(item, Mapping):
@@ -163,13 +174,13 @@ class RecommendationService:
                 else:
                     name = item
                 if isinstance(name, str):
-                    available.append(name.casefold())
-        preference_norm = [pref.casefold() for pref in preferences if isinstance(pref, str)]
-        matches = len([pref for pref in preference_norm if pref in available])
+                    available.add(name.casefold())
+        matches = sum(1 for pref in preferences if pref in available)
         return matches * weight
 
     @staticmethod
-    def _score_languages(event: Mapping[str, Any], preferences: Iterable[str]) -> float:
+    def _score_languages(event: Mapping[str, Any], preferences: List[str]) -> float:
+        """Score the event locales against already casefolded ``preferences``."""
         if not preferences:
             return 0.0
         locales: List[str] = []
@@ -185,7 +196,7 @@ class RecommendationService:
                         locales.append(locale.casefold())
         score = 0.0
         for preference in preferences:
-            if isinstance(preference, str) and preference.casefold() in locales:
+            if preference in locales:
                 score += 1.0
         return score
 
@@ -225,8 +236,6 @@ class RecommendationService:
 
     @staticmethod
     def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        from math import atan2, cos, radians, sin, sqrt
-
         radius = 6371.0
         phi1, phi2 = radians(lat1), radians(lat2)
         d_phi = radians(lat2 - lat1)
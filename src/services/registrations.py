@@ -3,16 +3,17 @@ from __future__ import annotations
 
 import base64
 import json
-import uuid
+import secrets
 from datetime import date, datetime, timedelta
 from io import BytesIO
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import qrcode
+from qrcode.image.pure import PyPNGImage
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy import func, select
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload
 
 from src.database import get_session
 from src.integrations.base import IntegrationError
@@ -37,6 +38,10 @@ __all__ = [
 ]
 
 
+# Rows fetched per round-trip when streaming registration listings.
+_STREAM_BATCH_SIZE = 500
+
+
 class RegistrationError(Exception):
     """Base class for registration related exceptions."""
 
@@ -117,7 +122,7 @@ class RegistrationService:
                 event,
                 email=clean_email,
                 full_name=full_name,
-                metadata=json.dumps(metadata_payload, sort_keys=True),
+                attendee_metadata=json.dumps(metadata_payload, sort_keys=True),
             )
             pricing = self._extract_pricing(event)
             if pricing:
@@ -129,7 +134,7 @@ class RegistrationService:
                     metadata=metadata_payload,
                 )
                 metadata_payload["payment"] = payment_metadata
-                registration.metadata = json.dumps(metadata_payload, sort_keys=True)
+                registration.attendee_metadata = json.dumps(metadata_payload, sort_keys=True)
                 self.session.flush()
             self.session.commit()
             return {
@@ -153,7 +158,7 @@ class RegistrationService:
         if registration.status in {"cancelled", "no_show"}:
             return {"status": registration.status}
 
-        metadata_payload = self._metadata_as_dict(registration.metadata)
+        metadata_payload = self._metadata_as_dict(registration.attendee_metadata)
         payment_info = metadata_payload.get("payment")
 
         registration.status = "cancelled"
@@ -164,7 +169,7 @@ class RegistrationService:
                 payment_info,
             )
             metadata_payload["payment"] = updated_payment
-            registration.metadata = json.dumps(metadata_payload, sort_keys=True)
+            registration.attendee_metadata = json.dumps(metadata_payload, sort_keys=True)
             self.session.flush()
         promoted = self._promote_waitlist_if_possible(registration.event)
         self.session.commit()
@@ -173,20 +178,46 @@ class RegistrationService:
             payload["promoted"] = [self._serialize_registration(item) for item in promoted]
         return payload
 
-    def list_registrations(self, event_id: int) -> List[Dict[str, Any]]:
-        event = self._get_event(event_id)
-        return [self._serialize_registration(reg) for reg in event.registrations]
-
-    def list_waitlist(self, event_id: int) -> List[Dict[str, Any]]:
-        event = self._get_event(event_id)
-        return [self._serialize_waitlist_entry(entry) for entry in event.waitlist_entries]
-
-    def list_attendance(self, event_id: int) -> List[Dict[str, Any]]:
-        event = self._get_event(event_id)
-        data: List[Dict[str, Any]] = []
-        for registration in event.registrations:
-            data.append(self._serialize_attendance(registration))
-        return data
+    def iter_registrations(
+        self, event_id: int, *, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield serialised registrations ordered by id, one batch at a time.
+
+        The event is checked up front so :class:`LookupError` surfaces before
+        the caller starts consuming rows.
+        """
+        self._get_event(event_id)
+        stmt = select(Registration).where(Registration.event_id == event_id)
+        rows = self.session.scalars(self._keyset_page(stmt, Registration.id, after_id, limit))
+        return (self._serialize_registration(registration) for registration in rows)
+
+    def iter_waitlist(
+        self, event_id: int, *, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        self._get_event(event_id)
+        stmt = select(WaitlistEntry).where(WaitlistEntry.event_id == event_id)
+        rows = self.session.scalars(self._keyset_page(stmt, WaitlistEntry.id, after_id, limit))
+        return (self._serialize_waitlist_entry(entry) for entry in rows)
+
+    def iter_attendance(
+        self, event_id: int, *, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        self._get_event(event_id)
+        # Check-in dashboards scan every registration of an event: select the
+        # five columns as plain rows instead of building ORM instances.
+        stmt = (
+            select(
+                Registration.id,
+                Registration.attendee_email,
+                Registration.status,
+                AttendanceRecord.check_in_time,
+                AttendanceRecord.check_in_method,
+            )
+            .outerjoin(AttendanceRecord, AttendanceRecord.registration_id == Registration.id)
+            .where(Registration.event_id == event_id)
+        )
+        rows = self.session.execute(self._keyset_page(stmt, Registration.id, after_id, limit))
+        return (self._serialize_attendance_row(row) for row in rows)
 
     def trigger_waitlist_promotion(self, event_id: int) -> List[Dict[str, Any]]:
         event = self._get_event(event_id)
@@ -247,32 +278,42 @@ class RegistrationService:
         return {"penalized": penalized}
 
     def send_reminders(self, within_days: int = 3) -> List[Dict[str, Any]]:
-        threshold = date.today() + timedelta(days=within_days)
+        today = date.today()
+        threshold = today + timedelta(days=within_days)
         query = (
-            select(Event)
+            select(Event.id, Event.event_date, Registration.attendee_email)
+            .join(Registration, Registration.event_id == Event.id)
             .where(Event.event_date <= threshold)
-            .where(Event.event_date >= date.today())
+            .where(Event.event_date >= today)
             .where(Event.registration_open.is_(True))
+            .where(Registration.status == "confirmed")
+            .order_by(Event.id, Registration.created_at)
         )
-        events = self.session.scalars(query).all()
-        reminders: List[Dict[str, Any]] = []
-        for event in events:
-            for registration in event.registrations:
-                if registration.status == "confirmed":
-                    reminders.append(
-                        {
-                            "event_id": event.id,
-                            "email": registration.attendee_email,
-                            "event_date": event.event_date.isoformat(),
-                        }
-                    )
-        return reminders
+        return [
+            {
+                "event_id": event_id,
+                "email": email,
+                "event_date": event_date.isoformat(),
+            }
+            for event_id, event_date, email in self.session.execute(query)
+        ]
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _keyset_page(stmt, key, after_id: Optional[int], limit: Optional[int]):
+        if after_id is not None:
+            stmt = stmt.where(key > after_id)
+        stmt = stmt.order_by(key)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)
+
     def _get_event(self, event_id: int) -> Event:
-        event = self.session.get(Event, event_id)
+        # Registration flows only read scalar columns of the event; skip the
+        # eager taxonomy/translation loads declared on the model.
+        event = self.session.get(Event, event_id, options=[lazyload("*")])
         if event is None:
             raise LookupError(f"Event {event_id} not found")
         return event
@@ -327,21 +368,20 @@ class RegistrationService:
         *,
         email: str,
         full_name: Optional[str],
-        metadata: Optional[str],
+        attendee_metadata: Optional[str],
     ) -> Registration:
-        token = uuid.uuid4().hex
+        token = secrets.token_hex(16)
         qr_code = self._build_qr_code(token)
         registration = Registration(
             event=event,
             attendee_email=email,
             attendee_name=full_name,
-            metadata=metadata,
+            attendee_metadata=attendee_metadata,
             check_in_token=token,
             qr_code_data=qr_code,
         )
         self.session.add(registration)
         self.session.flush()
-        self.session.refresh(registration)
         return registration
 
     def _create_waitlist_entry(
@@ -358,7 +398,6 @@ class RegistrationService:
         )
         self.session.add(entry)
         self.session.flush()
-        self.session.refresh(entry)
         return entry
 
     @staticmethod
@@ -481,7 +520,7 @@ class RegistrationService:
                 event,
                 email=entry.attendee_email,
                 full_name=entry.attendee_name,
-                metadata=json.dumps(metadata_payload, sort_keys=True),
+                attendee_metadata=json.dumps(metadata_payload, sort_keys=True),
             )
             if pricing:
                 payment_metadata = self._capture_payment(
@@ -492,7 +531,7 @@ class RegistrationService:
                     metadata=metadata_payload,
                 )
                 metadata_payload["payment"] = payment_metadata
-                registration.metadata = json.dumps(metadata_payload, sort_keys=True)
+                registration.attendee_metadata = json.dumps(metadata_payload, sort_keys=True)
                 self.session.flush()
             self.session.delete(entry)
             promoted.append(registration)
@@ -529,9 +568,10 @@ class RegistrationService:
         qr = qrcode.QRCode(version=1, box_size=5, border=2)
         qr.add_data(token)
         qr.make(fit=True)
-        image = qr.make_image(fill_color="black", back_color="white")
+        # PyPNG ships with qrcode, so PNG output does not depend on Pillow.
+        image = qr.make_image(image_factory=PyPNGImage)
         buffer = BytesIO()
-        image.save(buffer, format="PNG")
+        image.save(buffer)
         return base64.b64encode(buffer.getvalue()).decode("ascii")
 
     def _serialize_event_state(self, event: Event) -> Dict[str, Any]:
@@ -544,7 +584,7 @@ class RegistrationService:
         }
 
     def _serialize_registration(self, registration: Registration) -> Dict[str, Any]:
-        metadata_payload = self._metadata_as_dict(registration.metadata)
+        metadata_payload = self._metadata_as_dict(registration.attendee_metadata)
         payment_info = metadata_payload.get("payment")
         payload = {
             "id": registration.id,
@@ -574,6 +614,16 @@ class RegistrationService:
             "created_at": entry.created_at.isoformat(),
         }
 
+    @staticmethod
+    def _serialize_attendance_row(row) -> Dict[str, Any]:
+        return {
+            "registration_id": row.id,
+            "email": row.attendee_email,
+            "status": row.status,
+            "checked_in_at": row.check_in_time.isoformat() if row.check_in_time else None,
+            "method": row.check_in_method,
+        }
+
     def _serialize_attendance(self, registration: Registration) -> Dict[str, Any]:
         record = registration.attendance_record
         return {
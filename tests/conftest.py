@@ -1,13 +1,16 @@
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
+from sqlalchemy import event
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from src.database import Base, get_engine, get_session, init_engine
 from src.main import app
+from src.services.event_cache import clear_event_cache
 from src.services.events import EventService
 
 
@@ -68,6 +71,7 @@ def clean_database():
     with engine.begin() as connection:
         for table in reversed(Base.metadata.sorted_tables):
             connection.execute(table.delete())
+    clear_event_cache()
     yield
 
 
@@ -82,6 +86,27 @@ def seed_default_events():
         session.close()
 
 
+@pytest.fixture
+def count_queries():
+    """Count the SQL statements executed within a ``with`` block."""
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = get_engine()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _count
+
+
 @pytest.fixture
 def client(seed_default_events):
     app.config["TESTING"] = True
@@ -83,6 +83,37 @@ def test_template_instantiation_and_translations(client):
     assert event["settings"]["visibility"] == "public"
 
 
+def test_template_translation_writes_probe_the_locale(client, count_queries):
+    template_id = client.post(
+        "/event-templates", json={"name": "Probe template"}
+    ).json["template"]["id"]
+    for locale in ("fr-FR", "en-US"):
+        resp = client.post(
+            f"/event-templates/{template_id}/translations",
+            json={"locale": locale, "title": f"Titre {locale}"},
+        )
+        assert resp.status_code == 201
+
+    with count_queries() as statements:
+        update_resp = client.put(
+            f"/event-templates/{template_id}/translations/en-US",
+            json={"title": "Updated"},
+        )
+    assert update_resp.status_code == 200
+    assert update_resp.json["translation"]["title"] == "Updated"
+    # The template is read without its translations joined in.
+    assert not any(
+        "JOIN event_template_translations" in statement for statement in statements
+    )
+
+    assert client.delete(f"/event-templates/{template_id}/translations/fr-FR").status_code == 204
+    missing = client.delete(f"/event-templates/{template_id}/translations/fr-FR")
+    assert missing.status_code == 422
+
+    translations = client.get(f"/event-templates/{template_id}").json["template"]["translations"]
+    assert [(t["locale"], t["title"]) for t in translations] == [("en-US", "Updated")]
+
+
 def test_event_translation_workflow(client):
     create_resp = client.post(
         "/events",
@@ -310,3 +341,48 @@ def test_virtual_networking_feedback_and_partners_flow(client):
 
     final_sponsors = client.get(f"/events/{event_id}/sponsors")
     assert final_sponsors.json["total"] == 0
+
+
+def test_deleting_event_cascades_passive_children(client):
+    from sqlalchemy import func, select
+
+    from src.database import get_session
+    from src.models import Event, EventApproval, EventNotification
+
+    event_id = client.get("/events").json["events"][0]["id"]
+    session = get_session()
+    try:
+        session.add(EventApproval(event_id=event_id))
+        session.add(EventNotification(event_id=event_id, recipient="a@example.com", message="Hi"))
+        session.commit()
+
+        session.delete(session.get(Event, event_id))
+        session.commit()
+
+        for model in (EventApproval, EventNotification):
+            remaining = session.scalar(
+                select(func.count()).select_from(model).where(model.event_id == event_id)
+            )
+            assert remaining == 0
+    finally:
+        session.close()
+
+
+def test_bulk_create_returns_rows_in_input_order():
+    from src.database import get_session
+    from src.repositories.catalogs import CategoryRepository, TagRepository
+
+    names = [f"tag-{index:02d}" for index in range(40)][::-1]
+    session = get_session()
+    try:
+        tags = TagRepository(session).bulk_create([{"name": name} for name in names])
+        categories = CategoryRepository(session).bulk_create(
+            [{"name": "Zeta", "description": "z"}, {"name": "Alpha", "description": None}]
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    assert [tag.name for tag in tags] == names
+    assert all(tag.id is not None for tag in tags)
+    assert [(c.name, c.description) for c in categories] == [("Zeta", "z"), ("Alpha", None)]
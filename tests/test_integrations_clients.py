@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Any, Dict
 
+import pytest
+import requests
 import responses
 
-from src.config import ResilienceConfig, ServiceConfig
+from src.config import ResilienceConfig, ServiceConfig, _load_service_config
+from src.integrations.base import (
+    CircuitBreaker,
+    CircuitOpenError,
+    IntegrationError,
+    InvalidResponseError,
+)
 from src.integrations.calendar_service import CalendarServiceClient
 from src.integrations.email_service import EmailServiceClient
 from src.integrations.matching_service import MatchingServiceClient
@@ -46,6 +55,179 @@ def test_user_service_client_fetches_profile() -> None:
     assert profile["email"] == "user@example.com"
 
 
+@responses.activate
+def test_user_service_client_caches_profile_until_preferences_change() -> None:
+    config = _service_config("user_service", "http://users.test")
+    responses.add(
+        responses.GET,
+        "http://users.test/users/42",
+        json={"data": {"user_id": "42"}},
+        status=200,
+    )
+    responses.add(
+        responses.PUT,
+        "http://users.test/users/42/preferences",
+        json={"data": {"user_id": "42"}},
+        status=200,
+    )
+    client = UserServiceClient(config=config)
+    client.get_user_profile("42")["user_id"] = "mutated"
+    assert client.get_user_profile("42") == {"user_id": "42"}
+    assert len(responses.calls) == 1
+
+    client.update_preferences("42", {"preferred_tags": ["python"]})
+    client.get_user_profile("42")
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_circuit_breaker_opens_after_threshold() -> None:
+    config = ServiceConfig(
+        name="user_service",
+        base_url="http://users.test",
+        timeout=1.0,
+        resilience=ResilienceConfig(
+            max_attempts=1,
+            backoff_factor=0.01,
+            max_backoff=0.01,
+            circuit_breaker_failure_threshold=2,
+            circuit_breaker_reset_timeout=60.0,
+        ),
+    )
+    responses.add(responses.GET, "http://users.test/users/42", status=503)
+    client = UserServiceClient(config=config)
+    for _ in range(2):
+        with pytest.raises(IntegrationError):
+            client.get_user_profile("42")
+    with pytest.raises(CircuitOpenError):
+        client.get_user_profile("42")
+    assert len(responses.calls) == 2
+
+
+def test_circuit_breaker_allows_a_call_after_reset_timeout() -> None:
+    breaker = CircuitBreaker(
+        ResilienceConfig(circuit_breaker_failure_threshold=1, circuit_breaker_reset_timeout=0.05)
+    )
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    time.sleep(0.06)
+    breaker.allow()
+    breaker.allow()
+
+
+@responses.activate
+def test_http_client_truncates_error_bodies() -> None:
+    config = _service_config("payment_service", "http://payments.test")
+    responses.add(
+        responses.GET,
+        "http://payments.test/payments/pay_1",
+        body="x" * 10_000,
+        status=502,
+    )
+    client = PaymentServiceClient(config=config)
+    with pytest.raises(IntegrationError) as excinfo:
+        client.get_payment_status("pay_1")
+    assert "HTTP 502" in str(excinfo.value)
+    assert str(excinfo.value).count("x") <= 512
+
+
+@responses.activate
+def test_http_client_retries_connection_errors() -> None:
+    config = ServiceConfig(
+        name="social_service",
+        base_url="http://social.test",
+        timeout=1.0,
+        resilience=ResilienceConfig(
+            max_attempts=2,
+            backoff_factor=0.01,
+            max_backoff=0.01,
+            circuit_breaker_failure_threshold=5,
+            circuit_breaker_reset_timeout=0.01,
+        ),
+    )
+    responses.add(
+        responses.POST,
+        "http://social.test/shares/event",
+        body=requests.exceptions.ConnectionError("boom"),
+    )
+    responses.add(
+        responses.POST,
+        "http://social.test/shares/event",
+        json={"status": "shared"},
+        status=200,
+    )
+    client = SocialServiceClient(config=config)
+    assert client.publish_event({"event_id": 1})["status"] == "shared"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_http_client_does_not_retry_client_errors() -> None:
+    config = ServiceConfig(
+        name="user_service",
+        base_url="http://users.test",
+        timeout=1.0,
+        resilience=ResilienceConfig(
+            max_attempts=3,
+            backoff_factor=0.01,
+            max_backoff=0.01,
+            circuit_breaker_failure_threshold=1,
+            circuit_breaker_reset_timeout=60.0,
+        ),
+    )
+    responses.add(responses.GET, "http://users.test/users/42", status=404)
+    responses.add(responses.GET, "http://users.test/users/43", body="not json", status=200)
+    client = UserServiceClient(config=config)
+    with pytest.raises(InvalidResponseError):
+        client.get_user_profile("42")
+    with pytest.raises(InvalidResponseError):
+        client.get_user_profile("43")
+    # One call each: no retry, and the breaker (threshold 1) stayed closed.
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_http_client_retries_server_errors() -> None:
+    config = ServiceConfig(
+        name="social_service",
+        base_url="http://social.test",
+        timeout=1.0,
+        resilience=ResilienceConfig(
+            max_attempts=2,
+            backoff_factor=0.01,
+            max_backoff=0.01,
+            circuit_breaker_failure_threshold=5,
+            circuit_breaker_reset_timeout=0.01,
+        ),
+    )
+    responses.add(responses.POST, "http://social.test/shares/event", status=503)
+    responses.add(
+        responses.POST,
+        "http://social.test/shares/event",
+        json={"status": "shared"},
+        status=200,
+    )
+    client = SocialServiceClient(config=config)
+    assert client.publish_event({"event_id": 1})["status"] == "shared"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_http_client_serialises_payloads_like_stdlib_json() -> None:
+    config = _service_config("social_service", "http://social.test")
+    responses.add(
+        responses.POST, "http://social.test/shares/event", json={"status": "shared"}
+    )
+    client = SocialServiceClient(config=config)
+    client.publish_event({"counts": {1: "one"}})
+    assert json.loads(responses.calls[0].request.body) == {"counts": {"1": "one"}}
+
+    with pytest.raises(IntegrationError):
+        client.publish_event({"value": object()})
+    assert len(responses.calls) == 1
+
+
 @responses.activate
 def test_payment_service_capture_and_refund() -> None:
     config = _service_config("payment_service", "http://payments.test")
@@ -152,3 +334,17 @@ def test_matching_service_client() -> None:
     assert payloads["method"] == "/matching.MatchService/FindMatches"
     assert payloads["serialized"]["event_id"] == 99
     assert payloads["serialized"]["limit"] == 2
+
+
+def test_service_config_env_overrides(monkeypatch) -> None:
+    monkeypatch.setenv("SOCIAL_SERVICE_URL", "")
+    monkeypatch.setenv("SOCIAL_SERVICE_TIMEOUT", "")
+    monkeypatch.setenv("SOCIAL_SERVICE_MAX_ATTEMPTS", "7")
+    config = _load_service_config("social_service", default_url="http://social.test")
+    assert config.base_url == ""
+    assert config.timeout == 5.0
+    assert config.resilience.max_attempts == 7
+
+    monkeypatch.setenv("SOCIAL_SERVICE_TIMEOUT", "abc")
+    with pytest.raises(ValueError, match="SOCIAL_SERVICE_TIMEOUT"):
+        _load_service_config("social_service", default_url="http://social.test")
@@ -33,6 +33,28 @@ def test_get_events_with_filters(client):
     assert 'after' in error['details']
 
 
+def test_get_events_query_count_is_constant(client, count_queries):
+    with count_queries() as baseline:
+        assert client.get('/events').status_code == 200
+
+    category_id = client.post('/event-categories', json={'name': 'Tech'}).json['category']['id']
+    tag_id = client.post('/event-tags', json={'name': 'python'}).json['tag']['id']
+    for index in range(3):
+        response = client.post('/events', json={
+            'title': f'Extra {index}',
+            'date': '2025-09-01',
+            'category_ids': [category_id],
+            'tag_ids': [tag_id],
+        })
+        assert response.status_code == 201
+
+    with count_queries() as statements:
+        response = client.get('/events')
+    assert response.status_code == 200
+    assert len(response.json['events']) == 5
+    assert len(statements) == len(baseline)
+
+
 def test_create_event(client):
     response = client.post('/events', json={"title": "Test Event"})
     assert response.status_code == 201
@@ -110,6 +132,22 @@ def test_update_event(client):
     assert fetch_response.json['event']['attendees'] == 75
 
 
+def test_get_event_sees_writes_made_outside_event_routes(client):
+    from src.database import get_session
+    from src.services.events import EventService
+
+    event_id = client.get('/events').json['events'][0]['id']
+    assert client.get(f'/events/{event_id}').status_code == 200
+
+    session = get_session()
+    try:
+        EventService(session).update_event(event_id, {"title": "Titre modifie"})
+    finally:
+        session.close()
+
+    assert client.get(f'/events/{event_id}').json['event']['title'] == "Titre modifie"
+
+
 def test_update_event_validation_errors(client):
     create_response = client.post(
         '/events',
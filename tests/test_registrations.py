@@ -99,3 +99,75 @@ def test_no_show_detection_applies_penalty(client):
     assert registrations.status_code == 200
     statuses = {item["email"]: item["status"] for item in registrations.json["registrations"]}
     assert statuses["ghost@example.com"] == "no_show"
+
+
+def test_registration_listing_keyset_pagination(client):
+    event_id = create_event(client, attendees=5)
+    for index in range(3):
+        register(client, event_id, f"user{index}@example.com", f"User {index}")
+
+    first_page = client.get(f"/events/{event_id}/registrations?limit=2")
+    assert first_page.status_code == 200
+    items = first_page.json["registrations"]
+    assert len(items) == 2
+
+    next_page = client.get(
+        f"/events/{event_id}/registrations?after_id={items[-1]['id']}&limit=2"
+    )
+    remaining = next_page.json["registrations"]
+    assert [item["email"] for item in remaining] == ["user2@example.com"]
+
+    invalid = client.get(f"/events/{event_id}/registrations?limit=0")
+    assert invalid.status_code == 422
+
+    missing = client.get("/events/999999/registrations")
+    assert missing.status_code == 404
+
+
+def test_registration_rejects_non_json_bodies(client):
+    event_id = create_event(client)
+
+    wrong_type = client.post(
+        f"/events/{event_id}/registrations", data="email=a@example.com"
+    )
+    assert wrong_type.status_code == 415
+
+    malformed = client.post(
+        f"/events/{event_id}/registrations",
+        data="{not json",
+        content_type="application/json",
+    )
+    assert malformed.status_code == 400
+
+
+def test_send_reminders_selects_upcoming_confirmed_in_one_query(client, count_queries):
+    from src.database import get_session
+    from src.services.registrations import RegistrationService
+
+    today = date.today()
+    soon = create_event(client, date=(today + timedelta(days=2)).isoformat(), attendees=2)
+    later = create_event(client, date=(today + timedelta(days=10)).isoformat())
+    closed = create_event(client, date=(today + timedelta(days=1)).isoformat())
+    past = create_event(client, date=(today - timedelta(days=1)).isoformat())
+    for email in ("alice@example.com", "bob@example.com", "carol@example.com"):
+        register(client, soon, email, "Soon")
+    register(client, later, "dan@example.com", "Later")
+    register(client, closed, "erin@example.com", "Closed")
+    register(client, past, "frank@example.com", "Past")
+
+    session = get_session()
+    try:
+        service = RegistrationService(session)
+        service.close_registrations(closed)
+        with count_queries() as statements:
+            reminders = service.send_reminders(within_days=3)
+    finally:
+        session.close()
+
+    assert len(statements) == 1
+    # carol is waitlisted; the other events are closed or outside the window.
+    assert [(item["event_id"], item["email"]) for item in reminders] == [
+        (soon, "alice@example.com"),
+        (soon, "bob@example.com"),
+    ]
+    assert reminders[0]["event_date"] == (today + timedelta(days=2)).isoformat()
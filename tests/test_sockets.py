@@ -0,0 +1,115 @@
+import time
+
+import pytest
+
+from src.main import app, socketio
+
+
+@pytest.fixture
+def socket_clients():
+    clients = []
+
+    def _connect():
+        client = socketio.test_client(app)
+        clients.append(client)
+        return client
+
+    yield _connect
+    for client in clients:
+        if client.is_connected():
+            client.disconnect()
+
+
+def _wait_for(client, name, count=1, timeout=1.0):
+    received = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        received.extend(client.get_received())
+        if sum(1 for packet in received if packet["name"] == name) >= count:
+            break
+        time.sleep(0.01)
+    return received
+
+
+def _events(received, name):
+    return [packet["args"][0] for packet in received if packet["name"] == name]
+
+
+def test_chat_messages_are_coalesced_per_room(socket_clients):
+    listener = socket_clients()
+    sender = socket_clients()
+    listener.emit("join_event", {"event_id": 1})
+    sender.emit("join_event", {"event_id": 1})
+    listener.get_received()
+
+    sender.emit("chat_message", {"event_id": 1, "user": "ana", "message": "salut"})
+    sender.emit("chat_message", {"event_id": "1", "user": "ana", "message": "ça va ?"})
+
+    received = _wait_for(listener, "event:chat_batch")
+    batches = _events(received, "event:chat_batch")
+    assert len(batches) == 1
+    assert [item["message"] for item in batches[0]] == ["salut", "ça va ?"]
+    # Per-message events stay available for existing subscribers.
+    singles = _events(received, "event:chat")
+    assert [item["message"] for item in singles] == ["salut", "ça va ?"]
+    assert all(item["event_id"] == 1 for item in singles)
+
+
+def test_agenda_notifications_keep_per_message_events(socket_clients):
+    listener = socket_clients()
+    listener.emit("join_event", {"event_id": 2})
+    listener.get_received()
+
+    listener.emit("agenda_notification", {"event_id": 2, "slot": "10:00", "message": "Début"})
+
+    received = _wait_for(listener, "event:agenda_batch")
+    [single] = _events(received, "event:agenda")
+    assert (single["event_id"], single["slot"], single["message"]) == (2, "10:00", "Début")
+    assert _events(received, "event:agenda_batch") == [[single]]
+
+
+def test_join_event_rejects_invalid_ids(socket_clients):
+    client = socket_clients()
+    for event_id in (True, " 12", "+3", "abc"):
+        client.emit("join_event", {"event_id": event_id})
+        [packet] = client.get_received()
+        assert packet["name"] == "event:error"
+
+
+def test_join_event_accepts_several_rooms_without_echo(socket_clients):
+    first = socket_clients()
+    second = socket_clients()
+    joiner = socket_clients()
+    first.emit("join_event", {"event_id": 10})
+    second.emit("join_event", {"event_id": 11})
+    first.get_received()
+    second.get_received()
+
+    joiner.emit("join_event", {"event_ids": [10, "10", 11, "x"], "user": "ana"})
+
+    # The joiner is not told about its own join.
+    assert joiner.get_received() == []
+    # De-duplicated ids; each room gets a single presence packet.
+    for listener in (first, second):
+        [packet] = listener.get_received()
+        assert packet["name"] == "event:presence"
+        assert packet["args"][0]["event_ids"] == [10, 11]
+        assert packet["args"][0]["user"] == "ana"
+
+    # Messages now reach the joiner in both rooms.
+    first.emit("chat_message", {"event_id": 11, "message": "hello"})
+    received = _wait_for(joiner, "event:chat")
+    assert [item["event_id"] for item in _events(received, "event:chat")] == [11]
+
+
+def test_single_room_join_is_not_echoed(socket_clients):
+    listener = socket_clients()
+    joiner = socket_clients()
+    listener.emit("join_event", {"event_id": 12})
+    listener.get_received()
+
+    joiner.emit("join_event", {"event_id": 12, "user": "bob"})
+
+    assert joiner.get_received() == []
+    [packet] = listener.get_received()
+    assert packet["args"][0]["event_id"] == 12